@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import argparse
 import concurrent.futures
 from pathlib import Path
 from urllib.parse import urlparse
 
-import requests
+import httpfetch
+import metrics
+from lazyimport import lazy_import
+
+requests = lazy_import("requests")
 
 
 WEBSITES: list[str] = [
@@ -20,17 +25,20 @@ def _domain_from_url(url: str) -> str:
 	return parsed.netloc or parsed.path
 
 
-def scrape_ads_txt(session: requests.Session, url: str, output_dir: Path) -> Path | None:
+def scrape_ads_txt(fetcher: httpfetch.Fetcher, url: str, output_dir: Path) -> Path | None:
 	ads_url = f"{url.rstrip('/')}/ads.txt"
+	m = metrics.current()
 	try:
-		response = session.get(ads_url, timeout=10)
+		with m.timer("fetch", url=ads_url):
+			response = fetcher.get(ads_url, timeout=10)
 		if response.status_code != 200:
 			print(f"Failed to retrieve ads.txt from {url} (HTTP {response.status_code})")
 			return None
 
-		output_dir.mkdir(parents=True, exist_ok=True)
-		filename = output_dir / f"{_domain_from_url(url)}.txt"
-		filename.write_text(response.text, encoding="utf-8")
+		with m.timer("write", url=ads_url):
+			output_dir.mkdir(parents=True, exist_ok=True)
+			filename = output_dir / f"{_domain_from_url(url)}.txt"
+			filename.write_text(response.text, encoding="utf-8")
 		print(f"Successfully saved {filename}")
 		return filename
 	except requests.RequestException as exc:
@@ -39,14 +47,34 @@ def scrape_ads_txt(session: requests.Session, url: str, output_dir: Path) -> Pat
 
 
 def main() -> None:
-	if not WEBSITES:
+	parser = argparse.ArgumentParser(description="Download ads.txt files for a list of websites")
+	parser.add_argument(
+		"websites",
+		nargs="*",
+		default=WEBSITES,
+		help="Site URLs to fetch /ads.txt from (default: the built-in WEBSITES list)",
+	)
+	parser.add_argument(
+		"--output-dir",
+		type=Path,
+		default=OUTPUT_DIR,
+		help=f"Directory for <domain>.txt files (default: {OUTPUT_DIR})",
+	)
+	metrics.add_metrics_argument(parser)
+	args = parser.parse_args()
+	if args.metrics_out:
+		metrics.enable()
+
+	if not args.websites:
 		print("No websites configured.")
 		return
 
-	with requests.Session() as session:
-		session.headers.update({"User-Agent": "pyusage/1.0"})
-		with concurrent.futures.ThreadPoolExecutor(max_workers=min(16, len(WEBSITES))) as pool:
-			list(pool.map(lambda u: scrape_ads_txt(session, u, OUTPUT_DIR), WEBSITES))
+	fetcher = httpfetch.get_fetcher()
+	with concurrent.futures.ThreadPoolExecutor(max_workers=min(16, len(args.websites))) as pool:
+		list(pool.map(lambda u: scrape_ads_txt(fetcher, u, args.output_dir), args.websites))
+
+	if args.metrics_out:
+		metrics.current().write(args.metrics_out)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,259 @@
+"""Validate crawled ads.txt files against a local sellers.json corpus.
+
+Every sellers.json file is loaded once into a dict index (ad system domain ->
+seller id -> seller type and domain), so each ads.txt record is checked with
+two hash lookups instead of a scan over every exchange's sellers list. Files
+are validated in one streaming pass, optionally in a process pool, and a
+per-domain report is written as JSON lines.
+
+Usage: python adstxt_validate.py --ads-dir ads_txt_files --sellers-dir sellers_json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import time
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+import metrics
+from adstxt import OUTPUT_DIR
+
+
+SELLERS_DIR = Path("sellers_json")
+REPORT_PATH = Path("adstxt_report.ndjson")
+
+OK = "ok"
+INVALID = "invalid"
+# The ad system has no sellers.json in the corpus, so the record cannot be checked.
+UNVERIFIABLE = "unverifiable"
+# The seller id is not listed in the ad system's sellers.json.
+UNAUTHORIZED = "unauthorized"
+# DIRECT for an intermediary, or RESELLER for a publisher-only account.
+RELATIONSHIP_MISMATCH = "relationship_mismatch"
+# DIRECT record whose seller belongs to a different domain.
+DOMAIN_MISMATCH = "domain_mismatch"
+
+_RELATIONSHIPS = ("DIRECT", "RESELLER")
+# Directives (IAB ads.txt 1.1) that name further domains owned by the publisher.
+_DOMAIN_VARIABLES = ("OWNERDOMAIN", "MANAGERDOMAIN")
+
+# seller id -> (seller type, seller domain); confidential sellers have no domain.
+SellerIndex = dict[str, dict[str, tuple[str, str]]]
+
+_index: SellerIndex = {}
+
+
+class AdsRecord(NamedTuple):
+	line: int
+	ad_system: str
+	seller_id: str
+	relationship: str
+	cert_id: str
+
+
+def _normalize_domain(domain: str) -> str:
+	domain = domain.strip().lower().rstrip(".")
+	return domain[4:] if domain.startswith("www.") else domain
+
+
+def load_sellers(path: Path) -> dict[str, tuple[str, str]]:
+	"""Read one sellers.json file into seller id -> (seller type, domain)."""
+	with open(path, encoding="utf-8-sig") as f:
+		data = json.load(f)
+	sellers = {}
+	for seller in data.get("sellers") or ():
+		seller_id = str(seller.get("seller_id", "")).strip()
+		if seller_id:
+			seller_type = str(seller.get("seller_type", "")).upper()
+			sellers[seller_id] = (seller_type, _normalize_domain(str(seller.get("domain") or "")))
+	return sellers
+
+
+def load_seller_index(directory: Path) -> SellerIndex:
+	"""Load every `<ad system domain>.json` file in `directory`."""
+	index: SellerIndex = {}
+	for path in sorted(directory.glob("*.json")):
+		try:
+			index[_normalize_domain(path.stem)] = load_sellers(path)
+		except (OSError, ValueError) as exc:
+			print(f"Skipping unreadable sellers.json {path}: {exc}")
+	return index
+
+
+def parse_ads_txt(lines: Iterable[str]) -> Iterator[tuple[str, object]]:
+	"""Yield ("record", AdsRecord), ("variable", (name, value)) or ("invalid", (line, text)).
+
+	Comments and blank lines are skipped. A line is a variable when it has an
+	'=' before any ',' (e.g. "contact=ads@example.com").
+	"""
+	for number, raw in enumerate(lines, start=1):
+		text = raw.split("#", 1)[0].strip()
+		if not text:
+			continue
+		equals, comma = text.find("="), text.find(",")
+		if equals > 0 and (comma < 0 or equals < comma):
+			yield "variable", (text[:equals].strip().upper(), text[equals + 1:].strip())
+			continue
+		fields = [field.strip() for field in text.split(",")]
+		if len(fields) < 3 or not fields[0] or not fields[1] or fields[2].upper() not in _RELATIONSHIPS:
+			yield "invalid", (number, text)
+			continue
+		cert_id = fields[3] if len(fields) > 3 else ""
+		yield "record", AdsRecord(number, _normalize_domain(fields[0]), fields[1], fields[2].upper(), cert_id)
+
+
+def check_record(record: AdsRecord, publisher_domains: set[str], index: SellerIndex) -> str:
+	sellers = index.get(record.ad_system)
+	if sellers is None:
+		return UNVERIFIABLE
+	seller = sellers.get(record.seller_id)
+	if seller is None:
+		return UNAUTHORIZED
+	seller_type, seller_domain = seller
+	if record.relationship == "DIRECT" and seller_type == "INTERMEDIARY":
+		return RELATIONSHIP_MISMATCH
+	if record.relationship == "RESELLER" and seller_type == "PUBLISHER":
+		return RELATIONSHIP_MISMATCH
+	if record.relationship == "DIRECT" and seller_domain:
+		if not any(seller_domain == d or seller_domain.endswith("." + d) for d in publisher_domains):
+			return DOMAIN_MISMATCH
+	return OK
+
+
+def validate_ads_txt(domain: str, lines: Iterable[str], index: SellerIndex) -> dict:
+	"""Validate one publisher's ads.txt and return its report entry."""
+	counts: Counter[str] = Counter()
+	problems = []
+	records = []
+	publisher_domains = {_normalize_domain(domain)}
+	for kind, value in parse_ads_txt(lines):
+		if kind == "variable":
+			name, variable = value
+			if name in _DOMAIN_VARIABLES and variable:
+				publisher_domains.add(_normalize_domain(variable))
+		elif kind == "invalid":
+			number, text = value
+			counts[INVALID] += 1
+			problems.append({"line": number, "status": INVALID, "text": text})
+		else:
+			records.append(value)
+
+	# Records are checked after the whole file is read, since OWNERDOMAIN may
+	# appear anywhere in it.
+	for record in records:
+		status = check_record(record, publisher_domains, index)
+		counts[status] += 1
+		if status != OK:
+			problems.append({
+				"line": record.line,
+				"status": status,
+				"ad_system": record.ad_system,
+				"seller_id": record.seller_id,
+				"relationship": record.relationship,
+			})
+	problems.sort(key=lambda problem: problem["line"])
+	return {
+		"domain": domain,
+		"records": len(records) + counts[INVALID],
+		"counts": dict(counts),
+		"problems": problems,
+	}
+
+
+def _init_worker(index: SellerIndex) -> None:
+	global _index
+	_index = index
+
+
+def _validate_file(path: Path, index: Optional[SellerIndex] = None) -> dict:
+	try:
+		with open(path, encoding="utf-8-sig", errors="replace") as f:
+			return validate_ads_txt(path.stem, f, _index if index is None else index)
+	except OSError as exc:
+		return {"domain": path.stem, "records": 0, "counts": {}, "problems": [], "error": str(exc)}
+
+
+def validate_directory(
+	ads_dir: Path,
+	index: SellerIndex,
+	*,
+	processes: int = 1,
+	chunksize: int = 64,
+) -> Iterator[dict]:
+	"""Yield one report entry per `<domain>.txt` in `ads_dir`, in name order.
+
+	With `processes` > 1 the files are validated in a process pool; each worker
+	receives the seller index once, at start-up. `processes=0` uses every CPU.
+	"""
+	paths = sorted(ads_dir.glob("*.txt"))
+	if processes == 0:
+		processes = os.cpu_count() or 1
+	if processes <= 1 or len(paths) <= chunksize:
+		for path in paths:
+			yield _validate_file(path, index)
+		return
+	with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker, initargs=(index,)) as pool:
+		yield from pool.map(_validate_file, paths, chunksize=chunksize)
+
+
+def main() -> None:
+	parser = argparse.ArgumentParser(description="Validate crawled ads.txt files against local sellers.json files")
+	parser.add_argument(
+		"--ads-dir",
+		type=Path,
+		default=OUTPUT_DIR,
+		help=f"Directory of <domain>.txt files from adstxt.py (default: {OUTPUT_DIR})",
+	)
+	parser.add_argument(
+		"--sellers-dir",
+		type=Path,
+		default=SELLERS_DIR,
+		help=f"Directory of <ad system domain>.json sellers.json files (default: {SELLERS_DIR})",
+	)
+	parser.add_argument(
+		"--out",
+		type=Path,
+		default=REPORT_PATH,
+		help=f"Per-domain report, one JSON object per line (default: {REPORT_PATH})",
+	)
+	parser.add_argument(
+		"--processes",
+		type=int,
+		default=0,
+		help="Validate in this many worker processes; 0 uses every CPU (default: 0)",
+	)
+	metrics.add_metrics_argument(parser)
+	args = parser.parse_args()
+	m = metrics.enable() if args.metrics_out else metrics.current()
+
+	start = time.perf_counter()
+	with m.timer("load_sellers"):
+		index = load_seller_index(args.sellers_dir)
+	print(f"Loaded {sum(map(len, index.values()))} sellers from {len(index)} sellers.json files")
+
+	totals: Counter[str] = Counter()
+	domains = 0
+	with m.timer("validate"), open(args.out, "w", encoding="utf-8") as out:
+		for report in validate_directory(args.ads_dir, index, processes=args.processes):
+			out.write(json.dumps(report, ensure_ascii=False, separators=(",", ":")))
+			out.write("\n")
+			totals.update(report["counts"])
+			domains += 1
+	for status, count in totals.items():
+		m.inc("pyusage_adstxt_records_total", count, status=status)
+	if args.metrics_out:
+		m.write(args.metrics_out)
+
+	elapsed = time.perf_counter() - start
+	summary = ", ".join(f"{count} {status}" for status, count in totals.most_common())
+	print(f"Validated {domains} domains in {elapsed:.1f}s: {summary or 'no records'}")
+	print(f"Report written to {args.out}")
+
+
+if __name__ == "__main__":
+	main()
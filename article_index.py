@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import argparse
+import re
+import sqlite3
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import NamedTuple
+
+from summary_text import clean_summary
+
+
+DEFAULT_DB = Path("articles.db")
+
+# Han, kana and Hangul: scripts written without spaces between words.
+_CJK = "\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff\uac00-\ud7af"
+_SEGMENT_RE = re.compile(rf"[{_CJK}]+|[^\W_{_CJK}]+")
+_CJK_RE = re.compile(rf"[{_CJK}]")
+
+# Title matches count twice as much as summary matches when ranking.
+_TITLE_WEIGHT = 2.0
+_SUMMARY_WEIGHT = 1.0
+# BM25 costs roughly 10 us per matching row, so a very common term over
+# millions of articles is ranked among its most recently indexed matches only.
+DEFAULT_MAX_CANDIDATES = 5000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY,
+    link TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL,
+    published TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    feed TEXT NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+    title, summary, tokenize = 'unicode61 remove_diacritics 0', detail = column
+);
+"""
+
+
+def tokenize(text: str, *, query: bool = False) -> list[str]:
+    """Split text into index terms.
+
+    Latin-script (and other space-separated) words become lower-cased tokens.
+    Runs of CJK characters have no word boundaries, so they are indexed as
+    overlapping bigrams plus single characters; queries use only the bigrams
+    (or the single character for a one-character run), so a query matches any
+    article containing the same character sequence.
+    """
+    tokens: list[str] = []
+    for segment in _SEGMENT_RE.findall(text):
+        if not _CJK_RE.match(segment):
+            tokens.append(segment.lower())
+            continue
+        if len(segment) == 1:
+            tokens.append(segment)
+            continue
+        tokens.extend(segment[i:i + 2] for i in range(len(segment) - 1))
+        if not query:
+            tokens.extend(segment)
+    return tokens
+
+
+def plain_text(value: str) -> str:
+    """Drop HTML tags (and script and style contents) and decode entities."""
+    return clean_summary(value)
+
+
+class SearchHit(NamedTuple):
+    score: float
+    title: str
+    link: str
+    published: str
+    feed: str
+
+
+class ArticleIndex:
+    """Persistent full-text index over article titles and summaries.
+
+    Articles live in an SQLite database: an `articles` table keyed by link and
+    an FTS5 table holding the pre-tokenized text, ranked with BM25. Adding the
+    same article again is a no-op unless its title or summary changed, so the
+    index can be updated incrementally after every crawl.
+    """
+
+    def __init__(self, path: str | Path = DEFAULT_DB) -> None:
+        self.conn = sqlite3.connect(str(path))
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.executescript(_SCHEMA)
+
+    def add(self, articles: Iterable[dict[str, str]], feed: str = "") -> int:
+        """Index `articles`; return how many were new or changed."""
+        changed = 0
+        with self.conn:
+            for article in articles:
+                link = article["link"] or f"{feed}#{article['title']}"
+                title = plain_text(article["title"])
+                summary = plain_text(article["summary"])
+                row = self.conn.execute(
+                    "SELECT id, title, summary FROM articles WHERE link = ?", (link,)
+                ).fetchone()
+                if row is not None and row[1] == title and row[2] == summary:
+                    continue
+
+                if row is None:
+                    rowid = self.conn.execute(
+                        "INSERT INTO articles (link, title, published, summary, feed) VALUES (?, ?, ?, ?, ?)",
+                        (link, title, article["published"], summary, feed),
+                    ).lastrowid
+                else:
+                    rowid = row[0]
+                    self.conn.execute(
+                        "UPDATE articles SET title = ?, published = ?, summary = ?, feed = ? WHERE id = ?",
+                        (title, article["published"], summary, feed, rowid),
+                    )
+                    self.conn.execute("DELETE FROM articles_fts WHERE rowid = ?", (rowid,))
+                self.conn.execute(
+                    "INSERT INTO articles_fts (rowid, title, summary) VALUES (?, ?, ?)",
+                    (rowid, " ".join(tokenize(title)), " ".join(tokenize(summary))),
+                )
+                changed += 1
+        return changed
+
+    def search(self, query: str, limit: int = 10, max_candidates: int = DEFAULT_MAX_CANDIDATES) -> list[SearchHit]:
+        """Return the best `limit` articles containing every query term.
+
+        At most `max_candidates` matches (the most recently indexed ones) are
+        scored, which bounds query time however common the terms are; older
+        matches beyond the cap are never returned. Pass 0 to score every match.
+        """
+        terms = dict.fromkeys(tokenize(query, query=True))
+        if not terms:
+            return []
+        match = " AND ".join(f'"{term}"' for term in terms)
+        rows = self.conn.execute(
+            f"""
+            SELECT m.rank, a.title, a.link, a.published, a.feed
+            FROM (
+                SELECT rowid, bm25(articles_fts, {_TITLE_WEIGHT}, {_SUMMARY_WEIGHT}) AS rank
+                FROM articles_fts
+                WHERE articles_fts MATCH ?
+                ORDER BY rowid DESC
+                LIMIT ?
+            ) AS m JOIN articles AS a ON a.id = m.rowid
+            ORDER BY m.rank
+            LIMIT ?
+            """,
+            # SQLite treats a negative LIMIT as no limit.
+            (match, max_candidates or -1, limit),
+        ).fetchall()
+        # bm25() is lower-is-better; flip it so a higher score is a better match.
+        return [SearchHit(-rank, title, link, published, feed) for rank, title, link, published, feed in rows]
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+    def optimize(self) -> None:
+        """Merge the FTS5 index segments; worth running after large imports."""
+        with self.conn:
+            self.conn.execute("INSERT INTO articles_fts (articles_fts) VALUES ('optimize')")
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> ArticleIndex:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Full-text index and search over harvested RSS articles")
+    parser.add_argument("--db", type=Path, default=DEFAULT_DB, help=f"Index database (default: {DEFAULT_DB})")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    add = commands.add_parser("add", help="Fetch feeds and add their articles to the index")
+    add.add_argument("feed_urls", nargs="+", help="One or more RSS feed URLs")
+    add.add_argument("--processes", type=int, default=1, help="Parse feeds in this many processes; 0 uses every CPU")
+
+    query = commands.add_parser("query", help="Search the index")
+    query.add_argument("text", help="Search terms (English or Chinese)")
+    query.add_argument("--limit", type=int, default=10, help="Maximum number of results (default: 10)")
+    query.add_argument(
+        "--max-candidates",
+        type=int,
+        default=DEFAULT_MAX_CANDIDATES,
+        help=f"Rank only the most recently indexed N matches; 0 ranks every match (default: {DEFAULT_MAX_CANDIDATES})",
+    )
+
+    args = parser.parse_args()
+
+    with ArticleIndex(args.db) as index:
+        if args.command == "add":
+            import rss_news_parser
+
+            for feed_url, articles, error in rss_news_parser.iter_rss_feeds(args.feed_urls, processes=args.processes):
+                if error is not None:
+                    print(f"Error parsing feed {feed_url}: {error}")
+                    continue
+                changed = index.add(articles, feed=feed_url)
+                print(f"{feed_url}: {len(articles)} articles, {changed} new or updated")
+            print(f"Index now holds {len(index)} articles")
+            return
+
+        start = time.perf_counter()
+        hits = index.search(args.text, limit=args.limit, max_candidates=args.max_candidates)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        for rank, hit in enumerate(hits, start=1):
+            print(f"{rank:>3}. [{hit.score:.3f}] {hit.title}")
+            print(f"     {hit.link}  ({hit.published})")
+        print(f"{len(hits)} results in {elapsed_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
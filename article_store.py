@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Iterator
+from typing import overload
+
+
+def _split_link(link: str) -> tuple[str, str]:
+    """Split a link after its last '/' so the (shared) directory part can be interned."""
+    cut = link.rfind("/") + 1
+    return link[:cut], link[cut:]
+
+
+class ArticleRecord:
+    """One article as a slotted object: no per-instance dict."""
+
+    __slots__ = ("title", "link", "published", "summary", "feed")
+
+    def __init__(self, title: str, link: str, published: str, summary: str, feed: str = "") -> None:
+        self.title = title
+        self.link = link
+        self.published = published
+        self.summary = summary
+        self.feed = feed
+
+    def as_dict(self) -> dict[str, str]:
+        return {"title": self.title, "link": self.link, "published": self.published, "summary": self.summary}
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ArticleRecord):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self) -> str:
+        return f"ArticleRecord(title={self.title!r}, link={self.link!r})"
+
+
+class ArticleBatch:
+    """Columnar store for many articles.
+
+    Titles, dates and summaries are kept in one list per column. Feed URLs and
+    link prefixes (everything up to the last '/') repeat across thousands of
+    articles, so each distinct value is stored once and rows hold a compact
+    integer id in an `array`. Indexing or iterating gives the `Article` dict
+    view used by the rest of the code.
+    """
+
+    __slots__ = (
+        "titles",
+        "published",
+        "summaries",
+        "_feeds",
+        "_feed_ids",
+        "_feed_index",
+        "_prefixes",
+        "_prefix_ids",
+        "_prefix_index",
+        "_link_tails",
+    )
+
+    def __init__(self) -> None:
+        self.titles: list[str] = []
+        self.published: list[str] = []
+        self.summaries: list[str] = []
+        self._feeds: list[str] = []
+        self._feed_ids = array("I")
+        self._feed_index: dict[str, int] = {}
+        self._prefixes: list[str] = []
+        self._prefix_ids = array("I")
+        self._prefix_index: dict[str, int] = {}
+        self._link_tails: list[str] = []
+
+    @staticmethod
+    def _intern(value: str, values: list[str], index: dict[str, int]) -> int:
+        ident = index.get(value)
+        if ident is None:
+            ident = index[value] = len(values)
+            values.append(value)
+        return ident
+
+    def append(self, title: str, link: str, published: str, summary: str, feed: str = "") -> None:
+        prefix, tail = _split_link(link)
+        self.titles.append(title)
+        self.published.append(published)
+        self.summaries.append(summary)
+        self._feed_ids.append(self._intern(feed, self._feeds, self._feed_index))
+        self._prefix_ids.append(self._intern(prefix, self._prefixes, self._prefix_index))
+        self._link_tails.append(tail)
+
+    def extend(self, other: ArticleBatch) -> None:
+        for i in range(len(other)):
+            self.append(other.titles[i], other.link(i), other.published[i], other.summaries[i], other.feed(i))
+
+    @classmethod
+    def from_articles(cls, articles: Iterable[dict[str, str]], feed: str = "") -> ArticleBatch:
+        batch = cls()
+        for article in articles:
+            batch.append(article["title"], article["link"], article["published"], article["summary"], feed)
+        return batch
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    def link(self, i: int) -> str:
+        return self._prefixes[self._prefix_ids[i]] + self._link_tails[i]
+
+    def feed(self, i: int) -> str:
+        return self._feeds[self._feed_ids[i]]
+
+    @overload
+    def __getitem__(self, i: int) -> dict[str, str]: ...
+
+    @overload
+    def __getitem__(self, i: slice) -> list[dict[str, str]]: ...
+
+    def __getitem__(self, i: int | slice) -> dict[str, str] | list[dict[str, str]]:
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+            if i < 0:
+                raise IndexError("ArticleBatch index out of range")
+        return {
+            "title": self.titles[i],
+            "link": self.link(i),
+            "published": self.published[i],
+            "summary": self.summaries[i],
+        }
+
+    def __iter__(self) -> Iterator[dict[str, str]]:
+        return (self[i] for i in range(len(self)))
+
+    def as_dicts(self) -> list[dict[str, str]]:
+        return list(self)
+
+    def records(self) -> Iterator[ArticleRecord]:
+        for i in range(len(self)):
+            yield ArticleRecord(self.titles[i], self.link(i), self.published[i], self.summaries[i], self.feed(i))
+
+    def __getstate__(self) -> tuple:
+        # The lookup dicts are rebuilt on load, keeping pickles (e.g. results
+        # sent back from worker processes) small.
+        return (
+            self.titles,
+            self.published,
+            self.summaries,
+            self._feeds,
+            self._feed_ids,
+            self._prefixes,
+            self._prefix_ids,
+            self._link_tails,
+        )
+
+    def __setstate__(self, state: tuple) -> None:
+        (
+            self.titles,
+            self.published,
+            self.summaries,
+            self._feeds,
+            self._feed_ids,
+            self._prefixes,
+            self._prefix_ids,
+            self._link_tails,
+        ) = state
+        self._feed_index = {value: i for i, value in enumerate(self._feeds)}
+        self._prefix_index = {value: i for i, value in enumerate(self._prefixes)}
@@ -0,0 +1,70 @@
+"""Compare the memory used by list-of-dict articles and the compact stores.
+
+Builds the same synthetic crawl three ways (dicts, ArticleRecord objects and
+one ArticleBatch) and reports the bytes allocated for each with tracemalloc.
+
+Usage: python bench_articles.py [--articles 1000000] [--feeds 200]
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import tracemalloc
+
+from article_store import ArticleBatch, ArticleRecord
+
+
+def _rows(n: int, feeds: int):
+    for i in range(n):
+        feed = i % feeds
+        # Strings are built fresh per row, as they are when parsed from XML.
+        yield (
+            f"Headline number {i} from outlet {feed}",
+            f"https://outlet{feed}.example.com/news/2026/01/13/article-{i}",
+            "Tue, 13 Jan 2026 10:00:00 GMT",
+            f"Summary text for article {i}, long enough to look like a lede.",
+            f"https://outlet{feed}.example.com/rss",
+        )
+
+
+def _measure(build) -> tuple[int, object]:
+    gc.collect()
+    tracemalloc.start()
+    obj = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current, obj
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Memory benchmark for article containers")
+    parser.add_argument("--articles", type=int, default=200_000, help="Number of articles (default: 200000)")
+    parser.add_argument("--feeds", type=int, default=200, help="Number of distinct feeds (default: 200)")
+    args = parser.parse_args()
+
+    def build_dicts():
+        return [
+            {"title": t, "link": l, "published": p, "summary": s}
+            for t, l, p, s, _ in _rows(args.articles, args.feeds)
+        ]
+
+    def build_records():
+        return [ArticleRecord(t, l, p, s, f) for t, l, p, s, f in _rows(args.articles, args.feeds)]
+
+    def build_batch():
+        batch = ArticleBatch()
+        for row in _rows(args.articles, args.feeds):
+            batch.append(*row)
+        return batch
+
+    print(f"{args.articles} articles across {args.feeds} feeds")
+    baseline = None
+    for name, build in (("list[dict]", build_dicts), ("list[ArticleRecord]", build_records), ("ArticleBatch", build_batch)):
+        size, obj = _measure(build)
+        del obj
+        baseline = baseline or size
+        print(f"  {name:<20} {size / 2**20:9.1f} MiB  {size / args.articles:7.1f} B/article  {size / baseline:6.1%}")
+
+
+if __name__ == "__main__":
+    main()
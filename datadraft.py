@@ -1,27 +1,209 @@
 from __future__ import annotations
 
-import requests
-import pandas as pd
+import argparse
+import hashlib
+import io
+import json
+import os
+import tempfile
+from typing import Any, Optional
+
+import httpfetch
+import metrics
+from lazyimport import lazy_import
+
+# pandas takes a large share of start-up time; load it only when parsing.
+pd = lazy_import("pandas")
 
 
 URL = "https://en.wikipedia.org/wiki/List_of_companies_listed_on_the_Hong_Kong_Stock_Exchange"
+DEFAULT_KEY = "Stock code"
+
+
+def table_rows(df: pd.DataFrame, key: Optional[str] = DEFAULT_KEY) -> tuple[str, list[str], dict[str, list[str]]]:
+    """Return (key column, columns, rows keyed by that column) for a scraped table.
+
+    Cells are stored as strings (empty for missing values) so snapshots
+    compare exactly. If `key` is not a column the first column is used.
+    Repeated keys get a "#2", "#3"... suffix instead of overwriting each other.
+    """
+    columns = [
+        " / ".join(str(level) for level in dict.fromkeys(col)) if isinstance(col, tuple) else str(col)
+        for col in df.columns
+    ]
+    key_column = key if key in columns else columns[0]
+    key_index = columns.index(key_column)
+
+    rows: dict[str, list[str]] = {}
+    for values in df.fillna("").astype(str).itertuples(index=False, name=None):
+        values = list(values)
+        row_key = values[key_index]
+        n = 1
+        while row_key in rows:
+            n += 1
+            row_key = f"{values[key_index]}#{n}"
+        rows[row_key] = values
+    return key_column, columns, rows
+
+
+def diff_rows(
+    old_columns: list[str],
+    old_rows: dict[str, list[str]],
+    new_columns: list[str],
+    new_rows: dict[str, list[str]],
+) -> list[dict[str, Any]]:
+    """Return the changeset turning the old rows into the new ones.
+
+    Each change is one of
+    {"op": "insert", "key": k, "row": {column: value}},
+    {"op": "remove", "key": k} or
+    {"op": "change", "key": k, "changes": {column: [old, new]}}
+    (changed cells only; a column that appears or disappears counts as "").
+    """
+    changes: list[dict[str, Any]] = []
+    all_columns = list(dict.fromkeys(new_columns + old_columns))
+    for row_key, values in new_rows.items():
+        old_values = old_rows.get(row_key)
+        if old_values is None:
+            changes.append({"op": "insert", "key": row_key, "row": dict(zip(new_columns, values))})
+            continue
+        if old_values == values and old_columns == new_columns:
+            continue
+        old = dict(zip(old_columns, old_values))
+        new = dict(zip(new_columns, values))
+        cells = {
+            column: [old.get(column, ""), new.get(column, "")]
+            for column in all_columns
+            if old.get(column, "") != new.get(column, "")
+        }
+        if cells:
+            changes.append({"op": "change", "key": row_key, "changes": cells})
+    for row_key in old_rows:
+        if row_key not in new_rows:
+            changes.append({"op": "remove", "key": row_key})
+    return changes
+
+
+def load_snapshot(path: str) -> Optional[dict[str, Any]]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def _write_atomic(path: str, write) -> None:
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=".datadraft-")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+            write(f)
+        # mkstemp creates the file 0600; give it the permissions open() would,
+        # so jobs running as other users can still read the snapshot and changes.
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp, 0o666 & ~umask)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def save_snapshot(path: str, snapshot: dict[str, Any]) -> None:
+    _write_atomic(path, lambda f: json.dump(snapshot, f, ensure_ascii=False, separators=(",", ":")))
+
+
+def write_changeset(path: str, changes: list[dict[str, Any]]) -> None:
+    def write(f):
+        for change in changes:
+            f.write(json.dumps(change, ensure_ascii=False, separators=(",", ":")))
+            f.write("\n")
+
+    _write_atomic(path, write)
 
 
 def main() -> None:
-    with requests.Session() as session:
-        session.headers.update({"User-Agent": "pyusage/1.0"})
-        response = session.get(URL, timeout=20)
-        response.raise_for_status()
+    parser = argparse.ArgumentParser(
+        description="Scrape the Hong Kong Stock Exchange company table to CSV"
+    )
+    parser.add_argument("--url", default=URL, help="Page to scrape (default: the Wikipedia HKEX list)")
+    parser.add_argument("--output", default="output.csv", help="CSV file to write (default: output.csv)")
+    parser.add_argument(
+        "--snapshot",
+        default="datadraft.snapshot.json",
+        help="Keyed snapshot of the previous scrape (default: datadraft.snapshot.json)",
+    )
+    parser.add_argument(
+        "--changes",
+        default="changes.ndjson",
+        help="File receiving the inserted/removed/changed rows as JSON lines (default: changes.ndjson)",
+    )
+    parser.add_argument(
+        "--key",
+        default=DEFAULT_KEY,
+        help=f"Column identifying a row; the first column is used if it is missing (default: {DEFAULT_KEY!r})",
+    )
+    metrics.add_metrics_argument(parser)
+    args = parser.parse_args()
+    m = metrics.enable() if args.metrics_out else metrics.current()
+
+    with m.timer("fetch", url=args.url):
+        response = httpfetch.get_fetcher().get(args.url, timeout=20)
+    response.raise_for_status()
+
+    previous = load_snapshot(args.snapshot)
+    content_hash = hashlib.sha256(response.content).hexdigest()
+    unchanged = (
+        previous is not None
+        and previous.get("url") == args.url
+        and previous.get("content_sha256") == content_hash
+    )
+    if unchanged and os.path.exists(args.output):
+        # Nothing to parse: the table cannot have changed either.
+        write_changeset(args.changes, [])
+        m.inc("pyusage_unchanged_pages_total", url=args.url)
+        if args.metrics_out:
+            m.write(args.metrics_out)
+        print(f"Page unchanged since the last scrape; {args.output} is up to date")
+        return
 
     # pandas.read_html is implemented in optimized code paths and is generally
     # faster (and less error-prone) than manual BeautifulSoup table walking.
-    tables = pd.read_html(response.text)
+    with m.timer("parse", url=args.url):
+        # Literal HTML strings are deprecated in read_html; pass a file object.
+        tables = pd.read_html(io.StringIO(response.text))
     if not tables:
         raise RuntimeError("No tables found on page")
 
     df = tables[0]
-    df.to_csv("output.csv", index=False)
-    print("Data has been scraped and saved to output.csv")
+    key_column, columns, rows = table_rows(df, args.key)
+    if previous is not None and previous.get("url") == args.url and previous.get("key") == key_column:
+        changes = diff_rows(previous["columns"], previous["rows"], columns, rows)
+    else:
+        changes = diff_rows([], {}, columns, rows)
+
+    with m.timer("write", url=args.url):
+        write_changeset(args.changes, changes)
+        if changes or not os.path.exists(args.output):
+            df.to_csv(args.output, index=False)
+        save_snapshot(args.snapshot, {
+            "url": args.url,
+            "content_sha256": content_hash,
+            "key": key_column,
+            "columns": columns,
+            "rows": rows,
+        })
+    counts = {op: sum(c["op"] == op for c in changes) for op in ("insert", "remove", "change")}
+    m.inc("pyusage_rows_total", len(df), url=args.url)
+    for op, count in counts.items():
+        m.inc("pyusage_row_changes_total", count, url=args.url, op=op)
+    if args.metrics_out:
+        m.write(args.metrics_out)
+
+    print(
+        f"Data has been scraped and saved to {args.output}: {counts['insert']} inserted, "
+        f"{counts['remove']} removed, {counts['change']} changed (see {args.changes})"
+    )
 
 
 if __name__ == "__main__":
@@ -4,10 +4,12 @@ def create_app():
     app = Flask(__name__)
     
     # Load configuration settings
-    app.config.from_object('config')
+    app.config.from_object('config.Config')
 
     # Register blueprints
-    from .routes import main as main_routes
-    app.register_blueprint(main_routes)
+    from .routes.generator import generator_bp
+    app.register_blueprint(generator_bp)
+    from .routes.health import health_bp
+    app.register_blueprint(health_bp)
 
-    return app
\ No newline at end of file
+    return app
@@ -1,5 +1,7 @@
-from flask import Blueprint, request, jsonify
-from app.services.filename_service import generate_file_name
+import json
+
+from flask import Blueprint, Response, current_app, request, jsonify
+from app.services.filename_service import generate_file_name, generate_file_names
 
 generator_bp = Blueprint('generator', __name__)
 
@@ -9,6 +11,74 @@ def generate():
     prefix = data.get('prefix', '')
     suffix = data.get('suffix', '')
     extension = data.get('extension', 'txt')
-    
+
     file_name = generate_file_name(prefix=prefix, suffix=suffix, extension=extension)
-    return jsonify({'file_name': file_name})
\ No newline at end of file
+    return jsonify({'file_name': file_name})
+
+def _read_body(limit):
+    """Read the request body, or return None if it is longer than `limit` bytes.
+
+    Chunked bodies carry no Content-Length, so the size is enforced while
+    reading: at most `limit + 1` bytes are ever read.
+    """
+    chunks = []
+    size = 0
+    while size <= limit:
+        chunk = request.stream.read(limit + 1 - size)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        size += len(chunk)
+    return b''.join(chunks) if size <= limit else None
+
+@generator_bp.route('/generate/batch', methods=['POST'])
+def generate_batch():
+    """Stream `count` generated names back as NDJSON, one object per line."""
+    config = current_app.config
+    limit = config['MAX_BATCH_CONTENT_LENGTH']
+    if request.content_length is not None and request.content_length > limit:
+        return jsonify({'error': 'request body too large'}), 413
+    body = _read_body(limit)
+    if body is None:
+        return jsonify({'error': 'request body too large'}), 413
+
+    try:
+        data = json.loads(body) if request.is_json else None
+    except ValueError:
+        data = None
+    if not isinstance(data, dict):
+        return jsonify({'error': 'expected a JSON object'}), 400
+
+    prefixes = data.get('prefixes')
+    if prefixes is not None:
+        if not isinstance(prefixes, list) or not all(isinstance(p, str) for p in prefixes):
+            return jsonify({'error': 'prefixes must be a list of strings'}), 400
+    count = data.get('count', len(prefixes) if prefixes is not None else None)
+    if not isinstance(count, int) or isinstance(count, bool) or count < 1:
+        return jsonify({'error': 'count must be a positive integer'}), 400
+    if count > config['MAX_BATCH_SIZE']:
+        return jsonify({'error': f"count exceeds the maximum batch size of {config['MAX_BATCH_SIZE']}"}), 400
+    if prefixes is not None and len(prefixes) != count:
+        return jsonify({'error': 'count does not match the number of prefixes'}), 400
+
+    prefix = data.get('prefix', '')
+    suffix = data.get('suffix', '')
+    extension = data.get('extension', 'txt')
+    for field, value in (('prefix', prefix), ('suffix', suffix), ('extension', extension)):
+        if not isinstance(value, str):
+            return jsonify({'error': f'{field} must be a string'}), 400
+    chunk_size = config['BATCH_CHUNK_SIZE']
+
+    def stream():
+        for start in range(0, count, chunk_size):
+            n = min(chunk_size, count - start)
+            if prefixes is None:
+                names = generate_file_names(n, prefix=prefix, suffix=suffix, extension=extension)
+            else:
+                names = [p + name for p, name in zip(
+                    prefixes[start:start + n],
+                    generate_file_names(n, suffix=suffix, extension=extension),
+                )]
+            yield ''.join(json.dumps({'file_name': name}) + '\n' for name in names)
+
+    return Response(stream(), mimetype='application/x-ndjson')
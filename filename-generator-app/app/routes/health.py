@@ -0,0 +1,22 @@
+import os
+
+from flask import Blueprint, current_app, jsonify
+from app.services.filename_service import generate_random_string
+
+health_bp = Blueprint('health', __name__)
+
+@health_bp.route('/healthz', methods=['GET'])
+def healthz():
+    """Liveness: the worker process is up and serving requests."""
+    return jsonify({'status': 'ok', 'pid': os.getpid()})
+
+@health_bp.route('/readyz', methods=['GET'])
+def readyz():
+    """Readiness: configuration is loaded and this worker can generate names."""
+    if 'MAX_BATCH_SIZE' not in current_app.config:
+        return jsonify({'status': 'unavailable', 'reason': 'configuration not loaded'}), 503
+    try:
+        generate_random_string(1)
+    except Exception as exc:  # e.g. the OS entropy source is unavailable
+        return jsonify({'status': 'unavailable', 'reason': str(exc)}), 503
+    return jsonify({'status': 'ready', 'pid': os.getpid()})
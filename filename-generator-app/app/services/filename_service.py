@@ -1,18 +1,120 @@
-def generate_random_string(length=8):
-    import secrets
-    import string
+import datetime
+import os
+import secrets
+import string
+import threading
 
-    alphabet = string.ascii_letters + string.digits
-    return "".join(secrets.choice(alphabet) for _ in range(length))
+ALPHABET = string.ascii_letters + string.digits
+
+# Bytes at or above this value are discarded so that `byte % len(ALPHABET)`
+# maps every accepted byte to the alphabet without modulo bias.
+_ACCEPT_LIMIT = 256 - 256 % len(ALPHABET)
+_BYTE_TO_CHAR = bytes(ord(ALPHABET[b % len(ALPHABET)]) for b in range(256))
+_REJECTED_BYTES = bytes(range(_ACCEPT_LIMIT, 256))
+_ENTROPY_BLOCK_SIZE = 64 * 1024
+
+
+class _EntropyPool:
+    """Per-process buffer of unbiased alphabet characters.
+
+    Refilled from `secrets.token_bytes` one block at a time, so most names are
+    served without a system call. The buffer is discarded in forked children
+    (see `os.register_at_fork` below): pre-forked workers would otherwise hand
+    out the same buffered characters as their parent and each other.
+    """
+
+    def __init__(self, block_size=_ENTROPY_BLOCK_SIZE):
+        self._block_size = block_size
+        self._lock = threading.Lock()
+        self._buffer = b""
+        self._pos = 0
+
+    def chars(self, count: int) -> str:
+        if count < 0:
+            raise ValueError("count must be non-negative")
+        with self._lock:
+            available = len(self._buffer) - self._pos
+            if available < count:
+                chunks = [self._buffer[self._pos:]]
+                needed = count - available
+                while needed > 0:
+                    # Over-draw slightly to cover the rejected bytes (8 of every 256).
+                    size = max(self._block_size, needed + needed // 16 + 16)
+                    block = secrets.token_bytes(size).translate(_BYTE_TO_CHAR, _REJECTED_BYTES)
+                    chunks.append(block)
+                    needed -= len(block)
+                self._buffer = b"".join(chunks)
+                self._pos = 0
+            out = self._buffer[self._pos:self._pos + count]
+            self._pos += count
+        return out.decode("ascii")
+
+    def reset(self) -> None:
+        # Called in the child right after fork; the lock may have been held
+        # by another thread of the parent, so it is replaced, not acquired.
+        self._lock = threading.Lock()
+        self._buffer = b""
+        self._pos = 0
+
+
+_pool = _EntropyPool()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_pool.reset)
 
-def generate_file_name(prefix: str = "", suffix: str = "", extension: str = "txt") -> str:
-    import datetime
 
+def reset_entropy_pool():
+    """Drop buffered entropy; done automatically in forked child processes."""
+    _pool.reset()
+
+
+def generate_random_string(length=8):
+    return _random_chars(length)
+
+def generate_file_name(prefix: str = "", suffix: str = "", extension: str = "txt") -> str:
     now = datetime.datetime.now()
     year_str = now.strftime("%Y")
     random_str = generate_random_string()
     file_name = f"{prefix}{year_str}_{random_str}{suffix}.{extension}"
     return file_name
 
+def _random_chars(count: int) -> str:
+    """Return `count` unbiased alphabet characters from this process's entropy pool."""
+    return _pool.chars(count)
+
+def generate_file_names(
+    n: int,
+    prefix: str = "",
+    suffix: str = "",
+    extension: str = "txt",
+    length: int = 8,
+    unique: bool = False,
+) -> list[str]:
+    """Generate `n` file names in one batch.
+
+    Entropy is drawn in large blocks from `secrets.token_bytes` and the year is
+    formatted once per batch. With `unique=True` no name repeats within the batch.
+    """
+    if n < 0:
+        raise ValueError("n must be non-negative")
+    if length < 1:
+        raise ValueError("length must be at least 1")
+    if unique and n > len(ALPHABET) ** length:
+        raise ValueError(f"cannot generate {n} unique names of length {length}")
+
+    head = f"{prefix}{datetime.datetime.now().strftime('%Y')}_"
+    tail = f"{suffix}.{extension}"
+
+    chars = _random_chars(n * length)
+    names = [f"{head}{chars[i:i + length]}{tail}" for i in range(0, n * length, length)]
+
+    if unique:
+        seen = set()
+        for i, name in enumerate(names):
+            while name in seen:
+                name = f"{head}{_random_chars(length)}{tail}"
+            seen.add(name)
+            names[i] = name
+    return names
+
 def create_file_name(prefix: str, suffix: str, extension: str) -> str:
-    return generate_file_name(prefix, suffix, extension)
\ No newline at end of file
+    return generate_file_name(prefix, suffix, extension)
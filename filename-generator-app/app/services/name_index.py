@@ -0,0 +1,128 @@
+import hashlib
+import math
+import os
+import threading
+from pathlib import Path
+
+from app.services.filename_service import generate_file_name
+
+
+class NameIndex:
+    """Set of issued file names, optionally persisted to an append-only file.
+
+    With a `path`, previously issued names are loaded on start-up and each new
+    name is appended as one line, so the index survives restarts.
+    """
+
+    def __init__(self, path=None):
+        self._names = set()
+        self._lock = threading.Lock()
+        self._file = None
+        if path is not None:
+            path = Path(path)
+            if path.exists():
+                with path.open(encoding="utf-8") as f:
+                    self._names.update(line.rstrip("\n") for line in f if line.strip())
+            self._file = path.open("a", encoding="utf-8")
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._names
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def add(self, name: str) -> bool:
+        """Record `name`; return False if it had already been issued."""
+        with self._lock:
+            if name in self._names:
+                return False
+            self._names.add(name)
+            if self._file is not None:
+                self._file.write(name + "\n")
+                self._file.flush()
+            return True
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class BloomNameIndex:
+    """Bloom filter over issued names, with an optional confirm step.
+
+    The filter never misses an issued name but may report false positives. When
+    `confirm` is given, a positive answer is checked against it (for example a
+    directory listing or database lookup) before the name is treated as taken.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001, confirm=None):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self._confirm = confirm
+        self._lock = threading.Lock()
+
+    def _positions(self, name: str):
+        digest = hashlib.blake2b(name.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def might_contain(self, name: str) -> bool:
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(name))
+
+    def __contains__(self, name: str) -> bool:
+        if not self.might_contain(name):
+            return False
+        return self._confirm(name) if self._confirm is not None else True
+
+    def add(self, name: str) -> bool:
+        """Record `name`; return False if it is (or may be) already issued."""
+        with self._lock:
+            if name in self:
+                return False
+            for pos in self._positions(name):
+                self._bits[pos >> 3] |= 1 << (pos & 7)
+            return True
+
+
+def generate_unique_file_name(index, prefix: str = "", suffix: str = "", extension: str = "txt", max_attempts: int = 10) -> str:
+    """Generate a name that `index` has not issued before and record it."""
+    for _ in range(max_attempts):
+        file_name = generate_file_name(prefix=prefix, suffix=suffix, extension=extension)
+        if index.add(file_name):
+            return file_name
+    raise RuntimeError(f"Could not generate a unique file name after {max_attempts} attempts")
+
+
+def allocate_file_name(directory, prefix: str = "", suffix: str = "", extension: str = "txt", index=None, max_attempts: int = 10) -> Path:
+    """Atomically create an empty, previously unused file in `directory`.
+
+    The file is created with O_CREAT | O_EXCL, so concurrent workers (threads or
+    processes) sharing the directory can never be handed the same name and need
+    no global lock. An optional `index` skips names already known to be taken
+    without touching the filesystem.
+    """
+    directory = Path(directory)
+    for _ in range(max_attempts):
+        file_name = generate_file_name(prefix=prefix, suffix=suffix, extension=extension)
+        if index is not None and file_name in index:
+            continue
+        path = directory / file_name
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+        except FileExistsError:
+            if index is not None:
+                index.add(file_name)
+            continue
+        os.close(fd)
+        if index is not None:
+            index.add(file_name)
+        return path
+    raise RuntimeError(f"Could not allocate a unique file name in {directory} after {max_attempts} attempts")
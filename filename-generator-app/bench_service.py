@@ -0,0 +1,187 @@
+"""Load-test and latency benchmark for the filename generator service.
+
+Drives `/generate` and `/generate/batch` with a configurable number of
+concurrent clients and reports throughput and p50/p95/p99 latency, then
+times the name generation functions directly.
+
+Examples:
+    python bench_service.py
+    python bench_service.py --transport http --concurrency 32 --requests 5000
+    python bench_service.py --micro-only --json results.json
+"""
+import argparse
+import http.client
+import json
+import threading
+import time
+import timeit
+from concurrent.futures import ThreadPoolExecutor
+
+from werkzeug.serving import WSGIRequestHandler, make_server
+
+from app import create_app
+from app.services.filename_service import generate_file_name, generate_file_names, generate_random_string
+
+
+class _QuietRequestHandler(WSGIRequestHandler):
+    # Per-request access logging would dominate the measurements.
+    def log_request(self, *args, **kwargs):
+        pass
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, round(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def _in_process_client(app):
+    client = app.test_client()
+
+    def post(path, body):
+        response = client.post(path, json=body)
+        response.get_data()
+        return response.status_code
+
+    return post
+
+
+def _http_client(host, port):
+    # One keep-alive connection per worker thread.
+    conn = http.client.HTTPConnection(host, port, timeout=30)
+
+    def post(path, body):
+        conn.request("POST", path, body=json.dumps(body), headers={"Content-Type": "application/json"})
+        response = conn.getresponse()
+        response.read()
+        return response.status
+
+    return post
+
+
+def run_load(make_client, path, body, total_requests, concurrency):
+    """Send `total_requests` POSTs from `concurrency` threads; return raw timings."""
+    latencies = []
+    errors = 0
+    lock = threading.Lock()
+    per_worker = [total_requests // concurrency + (1 if i < total_requests % concurrency else 0) for i in range(concurrency)]
+
+    def worker(count):
+        nonlocal errors
+        post = make_client()
+        local_latencies = []
+        local_errors = 0
+        for _ in range(count):
+            start = time.perf_counter()
+            status = post(path, body)
+            local_latencies.append(time.perf_counter() - start)
+            if status != 200:
+                local_errors += 1
+        with lock:
+            latencies.extend(local_latencies)
+            errors += local_errors
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(worker, per_worker))
+    elapsed = time.perf_counter() - start
+    return latencies, errors, elapsed
+
+
+def summarize(name, latencies, errors, elapsed, names_per_request, concurrency):
+    latencies = sorted(latencies)
+    requests_per_s = len(latencies) / elapsed if elapsed else 0.0
+    return {
+        "scenario": name,
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "errors": errors,
+        "elapsed_s": elapsed,
+        "requests_per_s": requests_per_s,
+        "names_per_s": requests_per_s * names_per_request,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+    }
+
+
+def run_micro(number):
+    """Time the generation functions directly, in names per second."""
+    results = []
+    cases = [
+        ("generate_random_string", lambda: generate_random_string(), 1),
+        ("generate_file_name", lambda: generate_file_name("report_", "_v1", "txt"), 1),
+        ("generate_file_names[1000]", lambda: generate_file_names(1000, "report_", "_v1", "txt"), 1000),
+    ]
+    for name, func, names_per_call in cases:
+        calls = max(1, number // names_per_call)
+        best = min(timeit.repeat(func, number=calls, repeat=3))
+        results.append({
+            "benchmark": name,
+            "calls": calls,
+            "us_per_call": best / calls * 1e6,
+            "names_per_s": calls * names_per_call / best,
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the filename generator service.")
+    parser.add_argument("--transport", choices=["in-process", "http"], default="in-process",
+                        help="Call the app through Flask's test client or over HTTP on localhost (default: in-process).")
+    parser.add_argument("--concurrency", type=int, default=8, help="Number of concurrent clients (default: 8).")
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per load scenario (default: 2000).")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Names per /generate/batch request (default: 1000).")
+    parser.add_argument("--micro-number", type=int, default=100000, help="Names per microbenchmark (default: 100000).")
+    parser.add_argument("--micro-only", action="store_true", help="Only run the microbenchmarks.")
+    parser.add_argument("--json", metavar="PATH", help="Also write the results as JSON to PATH.")
+    args = parser.parse_args()
+
+    results = {"load": [], "micro": []}
+
+    if not args.micro_only:
+        app = create_app()
+        app.config["MAX_BATCH_SIZE"] = max(app.config["MAX_BATCH_SIZE"], args.batch_size)
+        server = None
+        if args.transport == "http":
+            server = make_server("127.0.0.1", 0, app, threaded=True, request_handler=_QuietRequestHandler)
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            make_client = lambda: _http_client("127.0.0.1", server.server_port)
+        else:
+            make_client = lambda: _in_process_client(app)
+
+        scenarios = [
+            ("single", "/generate", {"prefix": "report_", "suffix": "_v1", "extension": "txt"}, 1, args.requests),
+            ("batch", "/generate/batch", {"count": args.batch_size, "prefix": "report_"}, args.batch_size,
+             max(args.concurrency, args.requests // 10)),
+        ]
+        try:
+            for name, path, body, names_per_request, total in scenarios:
+                latencies, errors, elapsed = run_load(make_client, path, body, total, args.concurrency)
+                results["load"].append(summarize(name, latencies, errors, elapsed, names_per_request, args.concurrency))
+        finally:
+            if server is not None:
+                server.shutdown()
+
+        print(f"Load ({args.transport}, concurrency={args.concurrency}):")
+        for r in results["load"]:
+            print(
+                f"  {r['scenario']:<7} {r['requests']:>6} req  {r['requests_per_s']:>9.1f} req/s  "
+                f"{r['names_per_s']:>11.1f} names/s  p50={r['p50_ms']:.2f}ms  p95={r['p95_ms']:.2f}ms  "
+                f"p99={r['p99_ms']:.2f}ms  errors={r['errors']}"
+            )
+
+    results["micro"] = run_micro(args.micro_number)
+    print("Microbenchmarks:")
+    for r in results["micro"]:
+        print(f"  {r['benchmark']:<26} {r['us_per_call']:>10.2f} us/call  {r['names_per_s']:>12.1f} names/s")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,9 @@ class Config:
     DEBUG = os.environ.get('DEBUG', 'False').lower() in ['true', '1', 't']
     ALLOWED_EXTENSIONS = {'txt', 'pdf', 'png', 'jpg', 'jpeg', 'gif'}
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16 MB limit for file uploads
+    MAX_BATCH_SIZE = int(os.environ.get('MAX_BATCH_SIZE', 10000))
+    MAX_BATCH_CONTENT_LENGTH = 1 * 1024 * 1024  # 1 MB limit for batch requests
+    BATCH_CHUNK_SIZE = 1000  # names generated per streamed chunk
     FILE_NAME_PREFIX = "report_"
     FILE_NAME_SUFFIX = "_v1"
     FILE_NAME_EXTENSION = "txt"
\ No newline at end of file
@@ -0,0 +1,33 @@
+"""gunicorn settings for serving the app on every core of one machine.
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+The master loads the app once (`preload_app`), binds the listening socket
+and forks the workers, which all accept from that shared socket. Name
+generation is CPU-bound Python, so one single-threaded process per core
+sidesteps the GIL. Each worker starts with an empty entropy pool.
+"""
+import multiprocessing
+import os
+
+bind = os.environ.get("BIND", "0.0.0.0:8000")
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_class = "sync"
+preload_app = True
+# Batch responses stream up to MAX_BATCH_SIZE names; allow them time to finish.
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 30))
+graceful_timeout = 30
+keepalive = 2
+max_requests = 10000
+max_requests_jitter = 1000
+accesslog = os.environ.get("ACCESS_LOG")  # e.g. "-" for stdout; off by default
+errorlog = "-"
+
+
+def post_fork(server, worker):
+    # filename_service also does this through os.register_at_fork; calling it
+    # here keeps the guarantee explicit for the serving path.
+    from app.services.filename_service import reset_entropy_pool
+
+    reset_entropy_pool()
+    server.log.info("Worker %s ready", worker.pid)
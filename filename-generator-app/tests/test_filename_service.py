@@ -1,5 +1,10 @@
+import datetime
+import os
 import unittest
-from app.services.filename_service import generate_file_name
+from collections import Counter
+
+from app.services import filename_service
+from app.services.filename_service import generate_file_name, generate_file_names
 
 class TestFilenameService(unittest.TestCase):
 
@@ -30,5 +35,61 @@ class TestFilenameService(unittest.TestCase):
         
         self.assertTrue(file_name.endswith(f"{suffix}.{extension}"))
 
+    def test_generate_file_names_format(self):
+        names = generate_file_names(50, prefix="batch_", suffix="_v1", extension="csv")
+        year = str(datetime.datetime.now().year)
+
+        self.assertEqual(len(names), 50)
+        for name in names:
+            self.assertTrue(name.startswith(f"batch_{year}_"))
+            self.assertTrue(name.endswith("_v1.csv"))
+            random_part = name[len(f"batch_{year}_"):-len("_v1.csv")]
+            self.assertEqual(len(random_part), 8)
+            self.assertTrue(all(c in filename_service.ALPHABET for c in random_part))
+
+    def test_generate_file_names_empty_batch(self):
+        self.assertEqual(generate_file_names(0), [])
+
+    def test_generate_file_names_rejects_negative_count(self):
+        with self.assertRaises(ValueError):
+            generate_file_names(-1)
+
+    def test_generate_file_names_unique(self):
+        # 62**2 possible names, so duplicates are certain without the unique flag.
+        names = generate_file_names(3000, length=2, unique=True)
+        self.assertEqual(len(set(names)), 3000)
+
+    def test_generate_file_names_unique_impossible(self):
+        with self.assertRaises(ValueError):
+            generate_file_names(len(filename_service.ALPHABET) + 1, length=1, unique=True)
+
+    def test_negative_length_does_not_replay_entropy(self):
+        first = filename_service.generate_random_string(8)
+        with self.assertRaises(ValueError):
+            filename_service.generate_random_string(-8)
+        self.assertNotEqual(filename_service.generate_random_string(8), first)
+
+    def test_random_chars_covers_alphabet(self):
+        counts = Counter(filename_service._random_chars(62 * 1000))
+        self.assertEqual(set(counts), set(filename_service.ALPHABET))
+
+    @unittest.skipUnless(hasattr(os, 'fork'), 'requires os.fork')
+    def test_forked_children_do_not_share_entropy(self):
+        # Prime the parent's pool so buffered characters would be inherited.
+        filename_service._random_chars(1)
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            os.write(write_fd, filename_service._random_chars(32).encode('ascii'))
+            os._exit(0)
+        os.close(write_fd)
+        child = os.read(read_fd, 64).decode('ascii')
+        os.close(read_fd)
+        os.waitpid(pid, 0)
+
+        self.assertEqual(len(child), 32)
+        self.assertNotEqual(child, filename_service._random_chars(32))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,93 @@
+import io
+import json
+import unittest
+
+from app import create_app
+
+
+class TestGeneratorRoutes(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app()
+        self.app.config.update(TESTING=True, MAX_BATCH_SIZE=100, BATCH_CHUNK_SIZE=7)
+        self.client = self.app.test_client()
+
+    def _lines(self, response):
+        return [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+    def test_generate(self):
+        response = self.client.post('/generate', json={'prefix': 'report_', 'extension': 'csv'})
+
+        self.assertEqual(response.status_code, 200)
+        file_name = response.get_json()['file_name']
+        self.assertTrue(file_name.startswith('report_'))
+        self.assertTrue(file_name.endswith('.csv'))
+
+    def test_generate_batch_streams_ndjson(self):
+        response = self.client.post('/generate/batch', json={'count': 20, 'prefix': 'a_', 'suffix': '_v1'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, 'application/x-ndjson')
+        names = [item['file_name'] for item in self._lines(response)]
+        self.assertEqual(len(names), 20)
+        for name in names:
+            self.assertTrue(name.startswith('a_'))
+            self.assertTrue(name.endswith('_v1.txt'))
+
+    def test_generate_batch_with_prefixes(self):
+        prefixes = [f'item{i}_' for i in range(10)]
+        response = self.client.post('/generate/batch', json={'prefixes': prefixes})
+
+        names = [item['file_name'] for item in self._lines(response)]
+        self.assertEqual(len(names), 10)
+        for prefix, name in zip(prefixes, names):
+            self.assertTrue(name.startswith(prefix))
+
+    def test_generate_batch_rejects_mismatched_prefixes(self):
+        response = self.client.post('/generate/batch', json={'count': 3, 'prefixes': ['a_']})
+        self.assertEqual(response.status_code, 400)
+
+    def test_generate_batch_rejects_invalid_count(self):
+        for count in (0, -1, 'ten', True, None):
+            response = self.client.post('/generate/batch', json={'count': count})
+            self.assertEqual(response.status_code, 400)
+
+    def test_generate_batch_enforces_max_batch_size(self):
+        response = self.client.post('/generate/batch', json={'count': 101})
+        self.assertEqual(response.status_code, 400)
+
+    def test_generate_batch_enforces_content_length(self):
+        self.app.config['MAX_BATCH_CONTENT_LENGTH'] = 16
+        response = self.client.post('/generate/batch', json={'count': 1, 'prefix': 'x' * 64})
+        self.assertEqual(response.status_code, 413)
+
+    def test_generate_batch_enforces_content_length_for_chunked_bodies(self):
+        self.app.config['MAX_BATCH_CONTENT_LENGTH'] = 16
+        body = json.dumps({'count': 2, 'suffix': 'x' * 5000}).encode()
+        response = self.client.post(
+            '/generate/batch',
+            input_stream=io.BytesIO(body),
+            headers={'Transfer-Encoding': 'chunked', 'Content-Type': 'application/json'},
+            environ_overrides={'wsgi.input_terminated': True},
+        )
+        self.assertEqual(response.status_code, 413)
+
+    def test_generate_batch_accepts_chunked_bodies_within_limit(self):
+        body = json.dumps({'count': 2}).encode()
+        response = self.client.post(
+            '/generate/batch',
+            input_stream=io.BytesIO(body),
+            headers={'Transfer-Encoding': 'chunked', 'Content-Type': 'application/json'},
+            environ_overrides={'wsgi.input_terminated': True},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(self._lines(response)), 2)
+
+    def test_generate_batch_rejects_non_string_fields(self):
+        for field, value in (('prefix', 5), ('suffix', {'a': 1}), ('extension', None)):
+            response = self.client.post('/generate/batch', json={'count': 2, field: value})
+            self.assertEqual(response.status_code, 400, field)
+            self.assertEqual(response.get_json()['error'], f'{field} must be a string')
+
+if __name__ == '__main__':
+    unittest.main()
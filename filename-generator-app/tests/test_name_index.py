@@ -0,0 +1,108 @@
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+from app.services import name_index
+from app.services.name_index import BloomNameIndex, NameIndex, allocate_file_name, generate_unique_file_name
+
+
+class TestNameIndex(unittest.TestCase):
+
+    def test_add_reports_duplicates(self):
+        index = NameIndex()
+        self.assertTrue(index.add("a.txt"))
+        self.assertFalse(index.add("a.txt"))
+        self.assertIn("a.txt", index)
+        self.assertEqual(len(index), 1)
+
+    def test_persisted_index_survives_reload(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "issued.txt")
+            index = NameIndex(path)
+            index.add("a.txt")
+            index.add("b.txt")
+            index.close()
+
+            reloaded = NameIndex(path)
+            self.assertIn("a.txt", reloaded)
+            self.assertFalse(reloaded.add("b.txt"))
+            reloaded.close()
+
+
+class TestBloomNameIndex(unittest.TestCase):
+
+    def test_no_false_negatives(self):
+        index = BloomNameIndex(capacity=1000)
+        names = [f"name{i}.txt" for i in range(1000)]
+        for name in names:
+            index.add(name)
+        self.assertTrue(all(index.might_contain(name) for name in names))
+
+    def test_false_positive_rate(self):
+        index = BloomNameIndex(capacity=1000, error_rate=0.01)
+        for i in range(1000):
+            index.add(f"issued{i}")
+        false_positives = sum(index.might_contain(f"other{i}") for i in range(10000))
+        self.assertLess(false_positives, 300)
+
+    def test_confirm_step_overrides_false_positive(self):
+        issued = set()
+        index = BloomNameIndex(capacity=10, confirm=issued.__contains__)
+        index.add("a.txt")
+        issued.add("a.txt")
+        self.assertIn("a.txt", index)
+
+        # Pretend the filter reports a collision that the confirm step rejects.
+        with patch.object(index, "might_contain", return_value=True):
+            self.assertNotIn("b.txt", index)
+
+
+class TestAllocation(unittest.TestCase):
+
+    def test_generate_unique_file_name_retries(self):
+        names = iter(["dup.txt", "dup.txt", "new.txt"])
+        index = NameIndex()
+        with patch.object(name_index, "generate_file_name", side_effect=lambda **_: next(names)):
+            self.assertEqual(generate_unique_file_name(index), "dup.txt")
+            self.assertEqual(generate_unique_file_name(index), "new.txt")
+
+    def test_generate_unique_file_name_gives_up(self):
+        index = NameIndex()
+        index.add("dup.txt")
+        with patch.object(name_index, "generate_file_name", return_value="dup.txt"):
+            with self.assertRaises(RuntimeError):
+                generate_unique_file_name(index, max_attempts=3)
+
+    def test_allocate_file_name_skips_existing_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            open(os.path.join(tmp, "taken.txt"), "w").close()
+            names = iter(["taken.txt", "free.txt"])
+            index = NameIndex()
+            with patch.object(name_index, "generate_file_name", side_effect=lambda **_: next(names)):
+                path = allocate_file_name(tmp, index=index)
+
+            self.assertEqual(path.name, "free.txt")
+            self.assertTrue(path.exists())
+            self.assertIn("taken.txt", index)
+
+    def test_allocate_file_name_concurrent_workers(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            allocated = []
+
+            def worker():
+                for _ in range(50):
+                    allocated.append(allocate_file_name(tmp, prefix="w_"))
+
+            threads = [threading.Thread(target=worker) for _ in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+            self.assertEqual(len(set(allocated)), 400)
+            self.assertEqual(len(os.listdir(tmp)), 400)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import os
+import runpy
+import unittest
+from unittest.mock import Mock, patch
+
+from app import create_app
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestHealthRoutes(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app()
+        self.app.config.update(TESTING=True)
+        self.client = self.app.test_client()
+
+    def test_healthz(self):
+        response = self.client.get('/healthz')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json(), {'status': 'ok', 'pid': os.getpid()})
+
+    def test_readyz(self):
+        response = self.client.get('/readyz')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()['status'], 'ready')
+
+    def test_readyz_reports_entropy_failure(self):
+        with patch('app.routes.health.generate_random_string', side_effect=OSError('no entropy')):
+            response = self.client.get('/readyz')
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.get_json()['reason'], 'no entropy')
+
+
+class TestGunicornConfig(unittest.TestCase):
+
+    def test_workers_are_preforked_from_preloaded_app(self):
+        with patch.dict(os.environ, {'WEB_CONCURRENCY': '3'}):
+            settings = runpy.run_path(os.path.join(APP_DIR, 'gunicorn.conf.py'))
+
+        self.assertTrue(settings['preload_app'])
+        self.assertEqual(settings['workers'], 3)
+
+    def test_post_fork_resets_entropy_pool(self):
+        settings = runpy.run_path(os.path.join(APP_DIR, 'gunicorn.conf.py'))
+        with patch('app.services.filename_service.reset_entropy_pool') as reset:
+            settings['post_fork'](Mock(), Mock(pid=123))
+
+        reset.assert_called_once_with()
+
+    def test_wsgi_module_exposes_app(self):
+        wsgi = runpy.run_path(os.path.join(APP_DIR, 'wsgi.py'))
+        self.assertIn('/readyz', [rule.rule for rule in wsgi['app'].url_map.iter_rules()])
+
+
+if __name__ == '__main__':
+    unittest.main()
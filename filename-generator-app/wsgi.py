@@ -0,0 +1,11 @@
+"""WSGI entry point for production servers.
+
+The application (and its configuration) is created once at import time. With
+gunicorn's `preload_app` (see gunicorn.conf.py) that happens in the master
+process before the workers are forked.
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+"""
+from app import create_app
+
+app = create_app()
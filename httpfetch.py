@@ -0,0 +1,303 @@
+from __future__ import annotations
+
+import email.utils
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from urllib.parse import urlparse
+
+import metrics
+from lazyimport import lazy_import
+
+# requests (and urllib3 behind it) load on the first fetch, not on import.
+requests = lazy_import("requests")
+
+
+USER_AGENT = "pyusage/1.0"
+DEFAULT_CACHE_DIR = Path(os.environ.get("PYUSAGE_CACHE_DIR", Path.home() / ".cache" / "pyusage" / "http"))
+DEFAULT_CACHE_BYTES = 256 * 1024 * 1024
+HTTP_REQUESTS = "pyusage_http_requests_total"
+HTTP_BYTES = "pyusage_http_bytes_total"
+
+# Response headers worth keeping with a cached body.
+_STORED_HEADERS = (
+    "cache-control",
+    "content-type",
+    "date",
+    "etag",
+    "expires",
+    "last-modified",
+)
+
+
+def _parse_cache_control(value: str) -> dict[str, str | None]:
+    directives: dict[str, str | None] = {}
+    for part in value.split(","):
+        name, _, arg = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = arg.strip('"') if arg else None
+    return directives
+
+
+def _http_date(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return email.utils.parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def _freshness_lifetime(headers: dict[str, str]) -> float:
+    """Seconds a response stays fresh, following RFC 9111 section 4.2.1."""
+    directives = _parse_cache_control(headers.get("cache-control", ""))
+    # s-maxage applies only to shared caches; this is a private one.
+    if directives.get("max-age"):
+        try:
+            return max(0.0, float(directives["max-age"]))
+        except ValueError:
+            return 0.0
+    expires = _http_date(headers.get("expires"))
+    if expires is not None:
+        date = _http_date(headers.get("date")) or time.time()
+        return max(0.0, expires - date)
+    return 0.0
+
+
+class ResponseCache:
+    """On-disk HTTP response cache with size-bounded, least-recently-used eviction.
+
+    Each entry is a `<key>.json` metadata file next to a `<key>.body` file. Only
+    successful GET responses that allow storage (no `no-store`) and carry either
+    a freshness lifetime or a validator (`ETag` / `Last-Modified`) are kept.
+
+    The directory is scanned once, on first use; after that the total size
+    and the least-recently-used order are kept in memory, so a store costs
+    O(1) unless it pushes the cache over `max_bytes`.
+    """
+
+    def __init__(self, directory: Path = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_CACHE_BYTES) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # body path -> size, least recently used first; None until scanned.
+        self._entries: OrderedDict[Path, int] | None = None
+        self._total = 0
+
+    def _paths(self, url: str) -> tuple[Path, Path]:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.directory / f"{key}.json", self.directory / f"{key}.body"
+
+    def get(self, url: str) -> tuple[dict, bytes] | None:
+        meta_path, body_path = self._paths(url)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            body = body_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+        if meta.get("url") != url:
+            return None
+        # Touch the body so eviction treats this entry as recently used, in
+        # this process and (via the mtime) in the next one.
+        try:
+            os.utime(body_path)
+        except OSError:
+            pass
+        with self._lock:
+            if self._entries is not None and body_path in self._entries:
+                self._entries.move_to_end(body_path)
+        return meta, body
+
+    def is_fresh(self, meta: dict) -> bool:
+        directives = _parse_cache_control(meta["headers"].get("cache-control", ""))
+        if "no-cache" in directives:
+            return False
+        return time.time() - meta["stored_at"] < meta["lifetime"]
+
+    def store(self, url: str, response: requests.Response) -> None:
+        headers = {name: response.headers[name] for name in _STORED_HEADERS if name in response.headers}
+        directives = _parse_cache_control(headers.get("cache-control", ""))
+        if "no-store" in directives:
+            return
+        lifetime = _freshness_lifetime(headers)
+        if lifetime <= 0 and "etag" not in headers and "last-modified" not in headers:
+            return
+        self._write(url, headers, lifetime, response.content)
+
+    def refresh(self, url: str, meta: dict, not_modified: requests.Response, body: bytes) -> None:
+        """Update a stored entry after a 304 Not Modified revalidation."""
+        headers = dict(meta["headers"])
+        for name in _STORED_HEADERS:
+            if name in not_modified.headers:
+                headers[name] = not_modified.headers[name]
+        self._write(url, headers, _freshness_lifetime(headers), body)
+
+    def _write(self, url: str, headers: dict[str, str], lifetime: float, body: bytes) -> None:
+        meta_path, body_path = self._paths(url)
+        meta = {"url": url, "headers": headers, "lifetime": lifetime, "stored_at": time.time()}
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._load_entries()
+            # Write to temporary files first so readers never see a torn entry.
+            tmp_body = body_path.with_suffix(f".body.{os.getpid()}.tmp")
+            tmp_meta = meta_path.with_suffix(f".json.{os.getpid()}.tmp")
+            tmp_body.write_bytes(body)
+            tmp_meta.write_text(json.dumps(meta), encoding="utf-8")
+            os.replace(tmp_body, body_path)
+            os.replace(tmp_meta, meta_path)
+            self._total += len(body) - self._entries.pop(body_path, 0)
+            self._entries[body_path] = len(body)
+            if self._total > self.max_bytes:
+                self._evict()
+
+    def _load_entries(self) -> None:
+        """Scan the directory once for existing entries (called with the lock held)."""
+        if self._entries is not None:
+            return
+        found = []
+        for body_path in self.directory.glob("*.body"):
+            try:
+                stat = body_path.stat()
+            except OSError:
+                continue
+            found.append((stat.st_mtime, body_path, stat.st_size))
+        found.sort()
+        self._entries = OrderedDict((body_path, size) for _, body_path, size in found)
+        self._total = sum(self._entries.values())
+
+    def _evict(self) -> None:
+        while self._total > self.max_bytes and self._entries:
+            body_path, size = self._entries.popitem(last=False)
+            body_path.unlink(missing_ok=True)
+            body_path.with_suffix(".json").unlink(missing_ok=True)
+            self._total -= size
+
+
+def _cached_response(url: str, meta: dict, body: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.url = url
+    response.headers = requests.structures.CaseInsensitiveDict(meta["headers"])
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    response._content = body
+    return response
+
+
+class Fetcher:
+    """Shared HTTP client for the scraping scripts.
+
+    - one `requests.Session` whose adapter keeps a connection pool per host,
+    - retries with exponential backoff on connection errors, 429 and 5xx
+      (honouring `Retry-After`),
+    - a global budget on the number of requests in flight across threads,
+    - an optional on-disk `ResponseCache` that serves fresh entries without a
+      request and revalidates stale ones with `If-None-Match` /
+      `If-Modified-Since`.
+    """
+
+    def __init__(
+        self,
+        *,
+        cache: ResponseCache | None = None,
+        max_concurrency: int = 16,
+        retries: int = 3,
+        backoff_factor: float = 0.5,
+        timeout: float | tuple[float, float] = (5.0, 20.0),
+        max_hosts: int = 32,
+    ) -> None:
+        from urllib3.util.retry import Retry
+
+        self.cache = cache
+        self.timeout = timeout
+        self._budget = threading.BoundedSemaphore(max(1, max_concurrency))
+
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({"GET", "HEAD"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = requests.adapters.HTTPAdapter(pool_connections=max_hosts, pool_maxsize=max(1, max_concurrency), max_retries=retry)
+        self.session = requests.Session()
+        self.session.headers.update({"User-Agent": USER_AGENT})
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def get(self, url: str, *, timeout: float | tuple[float, float] | None = None) -> requests.Response:
+        """GET `url`, serving or revalidating from the cache when possible.
+
+        With instrumentation enabled this records the stages `queue` (waiting
+        for the concurrency budget), `request` (DNS, connect and time to the
+        response headers, which requests does not report separately) and
+        `download` (reading the body), plus request and byte counters per host.
+        """
+        m = metrics.current()
+        host = urlparse(url).netloc
+        cached = self.cache.get(url) if self.cache is not None else None
+        if cached is not None and self.cache.is_fresh(cached[0]):
+            m.inc(HTTP_REQUESTS, host=host, result="cache_hit")
+            return _cached_response(url, *cached)
+
+        headers = {}
+        if cached is not None:
+            meta = cached[0]
+            if "etag" in meta["headers"]:
+                headers["If-None-Match"] = meta["headers"]["etag"]
+            if "last-modified" in meta["headers"]:
+                headers["If-Modified-Since"] = meta["headers"]["last-modified"]
+
+        with m.timer("queue", url=url):
+            self._budget.acquire()
+        try:
+            start = time.perf_counter()
+            response = self.session.get(url, headers=headers, timeout=timeout or self.timeout)
+            elapsed = time.perf_counter() - start
+        except Exception:
+            m.inc(HTTP_REQUESTS, host=host, result="error")
+            raise
+        finally:
+            self._budget.release()
+
+        if m.enabled:
+            headers_s = response.elapsed.total_seconds()
+            m.observe(metrics.STAGE_SECONDS, headers_s, stage="request", url=url)
+            m.observe(metrics.STAGE_SECONDS, max(0.0, elapsed - headers_s), stage="download", url=url)
+            m.inc(HTTP_BYTES, len(response.content), host=host)
+
+        if cached is not None and response.status_code == 304:
+            m.inc(HTTP_REQUESTS, host=host, result="revalidated")
+            meta, body = cached
+            self.cache.refresh(url, meta, response, body)
+            return _cached_response(url, meta, body)
+        m.inc(HTTP_REQUESTS, host=host, result=str(response.status_code))
+        if self.cache is not None and response.status_code == 200:
+            self.cache.store(url, response)
+        return response
+
+    def close(self) -> None:
+        self.session.close()
+
+    def __enter__(self) -> Fetcher:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+_default_fetcher: Fetcher | None = None
+_default_lock = threading.Lock()
+
+
+def get_fetcher() -> Fetcher:
+    """Return the process-wide fetcher (with the default on-disk cache)."""
+    global _default_fetcher
+    with _default_lock:
+        if _default_fetcher is None:
+            _default_fetcher = Fetcher(cache=ResponseCache())
+        return _default_fetcher
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import importlib.util
+import sys
+from types import ModuleType
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Return module `name` without executing it until an attribute is used.
+
+    The module is located immediately, so a missing dependency still raises
+    ModuleNotFoundError at import time, but its (often expensive) body only runs
+    on first attribute access. Scripts use this for heavy dependencies so that
+    `--help` and other short code paths start quickly.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
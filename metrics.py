@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import bisect
+import json
+import math
+import threading
+import time
+from contextlib import nullcontext
+from pathlib import Path
+
+
+# Upper bounds (seconds) of the stage-duration histogram buckets.
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, math.inf,
+)
+
+STAGE_SECONDS = "pyusage_stage_seconds"
+STAGE_ERRORS = "pyusage_stage_errors_total"
+
+_LabelKey = tuple[tuple[str, str], ...]
+
+
+def _label_key(labels: dict[str, object]) -> _LabelKey:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(key: _LabelKey, extra: tuple[tuple[str, str], ...] = ()) -> str:
+    pairs = key + extra
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _format_le(bound: float) -> str:
+    return "+Inf" if math.isinf(bound) else repr(bound)
+
+
+class _Histogram:
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self, size: int) -> None:
+        self.counts = [0] * size
+        self.sum = 0.0
+        self.count = 0
+
+
+class _Timer:
+    __slots__ = ("_metrics", "_labels", "_start")
+
+    def __init__(self, metrics: Metrics, labels: dict[str, object]) -> None:
+        self._metrics = metrics
+        self._labels = labels
+
+    def __enter__(self) -> _Timer:
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._metrics.observe(STAGE_SECONDS, time.perf_counter() - self._start, **self._labels)
+        if exc_type is not None:
+            self._metrics.inc(STAGE_ERRORS, **self._labels)
+
+
+class Metrics:
+    """In-process counters and histograms, exportable as Prometheus text or JSON."""
+
+    enabled = True
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        if not buckets or not math.isinf(buckets[-1]):
+            buckets = tuple(buckets) + (math.inf,)
+        self.buckets = tuple(buckets)
+        self._counters: dict[tuple[str, _LabelKey], float] = {}
+        self._histograms: dict[tuple[str, _LabelKey], _Histogram] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, name: str, value: float = 1.0, **labels: object) -> None:
+        key = (name, _label_key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0.0) + value
+
+    def observe(self, name: str, value: float, **labels: object) -> None:
+        key = (name, _label_key(labels))
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            hist = self._histograms.get(key)
+            if hist is None:
+                hist = self._histograms[key] = _Histogram(len(self.buckets))
+            hist.counts[index] += 1
+            hist.sum += value
+            hist.count += 1
+
+    def timer(self, stage: str, **labels: object) -> _Timer:
+        """Context manager recording the duration of `stage` in STAGE_SECONDS."""
+        return _Timer(self, {"stage": stage, **labels})
+
+    def to_prometheus(self) -> str:
+        lines: list[str] = []
+        with self._lock:
+            counters = sorted(self._counters.items())
+            histograms = sorted(self._histograms.items(), key=lambda item: item[0])
+
+        seen: set[str] = set()
+        for (name, key), value in counters:
+            if name not in seen:
+                seen.add(name)
+                lines.append(f"# TYPE {name} counter")
+            lines.append(f"{name}{_format_labels(key)} {value:g}")
+
+        for (name, key), hist in histograms:
+            if name not in seen:
+                seen.add(name)
+                lines.append(f"# TYPE {name} histogram")
+            cumulative = 0
+            for bound, count in zip(self.buckets, hist.counts):
+                cumulative += count
+                lines.append(f"{name}_bucket{_format_labels(key, (('le', _format_le(bound)),))} {cumulative}")
+            lines.append(f"{name}_sum{_format_labels(key)} {hist.sum:g}")
+            lines.append(f"{name}_count{_format_labels(key)} {hist.count}")
+        return "\n".join(lines) + "\n"
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            counters = sorted(self._counters.items())
+            histograms = sorted(self._histograms.items(), key=lambda item: item[0])
+        return {
+            "counters": [
+                {"name": name, "labels": dict(key), "value": value}
+                for (name, key), value in counters
+            ],
+            "histograms": [
+                {
+                    "name": name,
+                    "labels": dict(key),
+                    "count": hist.count,
+                    "sum": hist.sum,
+                    "buckets": {_format_le(b): c for b, c in zip(self.buckets, hist.counts)},
+                }
+                for (name, key), hist in histograms
+            ],
+        }
+
+    def merge(self, data: dict) -> None:
+        """Add in counters and histograms exported by another registry's `to_dict`.
+
+        Used to collect what worker processes recorded. Histograms must use
+        the same buckets as this registry.
+        """
+        bounds = {_format_le(b): i for i, b in enumerate(self.buckets)}
+        with self._lock:
+            for counter in data.get("counters", ()):
+                key = (counter["name"], _label_key(counter["labels"]))
+                self._counters[key] = self._counters.get(key, 0.0) + counter["value"]
+            for item in data.get("histograms", ()):
+                if set(item["buckets"]) != set(bounds):
+                    raise ValueError(f"histogram {item['name']} uses different buckets")
+                key = (item["name"], _label_key(item["labels"]))
+                hist = self._histograms.get(key)
+                if hist is None:
+                    hist = self._histograms[key] = _Histogram(len(self.buckets))
+                for bound, count in item["buckets"].items():
+                    hist.counts[bounds[bound]] += count
+                hist.sum += item["sum"]
+                hist.count += item["count"]
+
+    def write(self, path: str | Path) -> None:
+        """Write to `path`: JSON if it ends in `.json`, Prometheus text otherwise."""
+        path = Path(path)
+        if path.suffix == ".json":
+            path.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+        else:
+            path.write_text(self.to_prometheus(), encoding="utf-8")
+
+
+class _NullMetrics:
+    """Stand-in used while instrumentation is off; every hook is a no-op."""
+
+    enabled = False
+    _timer = nullcontext()
+
+    def inc(self, name: str, value: float = 1.0, **labels: object) -> None:
+        pass
+
+    def observe(self, name: str, value: float, **labels: object) -> None:
+        pass
+
+    def timer(self, stage: str, **labels: object) -> nullcontext:
+        return self._timer
+
+    def merge(self, data: dict) -> None:
+        pass
+
+
+NULL_METRICS = _NullMetrics()
+_current: Metrics | _NullMetrics = NULL_METRICS
+
+
+def current() -> Metrics | _NullMetrics:
+    """Return the active registry (NULL_METRICS unless `enable()` was called)."""
+    return _current
+
+
+def enable(registry: Metrics | None = None) -> Metrics:
+    """Turn instrumentation on for this process and return the registry."""
+    global _current
+    _current = registry if registry is not None else Metrics()
+    return _current
+
+
+def disable() -> None:
+    global _current
+    _current = NULL_METRICS
+
+
+def add_metrics_argument(parser) -> None:
+    parser.add_argument(
+        "--metrics-out",
+        metavar="PATH",
+        help="Record per-stage timings and counters and write them to PATH "
+        "(JSON if PATH ends in .json, Prometheus text format otherwise).",
+    )
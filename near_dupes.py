@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+from array import array
+from collections.abc import Sequence
+from pathlib import Path
+
+from article_index import plain_text, tokenize
+
+
+DEFAULT_NUM_PERM = 64
+DEFAULT_BANDS = 16
+DEFAULT_THRESHOLD = 0.5
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "pyusage" / "signatures.db"
+
+_HASH_BITS = 64
+_EMPTY = (1 << _HASH_BITS) - 1
+
+
+def _shingles(text: str) -> set[str]:
+    """Pairs of consecutive terms (single terms for one-term texts)."""
+    tokens = tokenize(plain_text(text), query=True)
+    if len(tokens) < 2:
+        return set(tokens)
+    return {f"{a} {b}" for a, b in zip(tokens, tokens[1:])}
+
+
+def minhash_signature(text: str, num_perm: int = DEFAULT_NUM_PERM) -> array:
+    """MinHash signature of `text`; matching positions estimate Jaccard similarity.
+
+    Uses one-permutation hashing: each shingle is hashed once, and the hash
+    picks one of `num_perm` bins and a value within it. Empty bins are filled
+    from the next non-empty bin ("densification"). This costs O(shingles) per
+    article instead of O(shingles * num_perm) for classic MinHash.
+    """
+    bin_range = (1 << _HASH_BITS) // num_perm
+    mins = [_EMPTY] * num_perm
+    for shingle in _shingles(text):
+        h = int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "little")
+        slot, value = divmod(h, bin_range)
+        if value < mins[slot]:
+            mins[slot] = value
+
+    filled = [i for i, value in enumerate(mins) if value != _EMPTY]
+    if filled and len(filled) < num_perm:
+        # Rotation densification: borrow from the next filled bin to the right,
+        # offset by the distance so borrowed values stay distinguishable.
+        sig = list(mins)
+        for i in range(num_perm):
+            if mins[i] != _EMPTY:
+                continue
+            for distance in range(1, num_perm):
+                source = mins[(i + distance) % num_perm]
+                if source != _EMPTY:
+                    sig[i] = source + distance * bin_range
+                    break
+        mins = sig
+    return array("Q", mins)
+
+
+def similarity(sig_a: Sequence[int], sig_b: Sequence[int]) -> float:
+    """Estimated Jaccard similarity of the texts behind two signatures."""
+    return sum(x == y for x, y in zip(sig_a, sig_b)) / len(sig_a)
+
+
+class SignatureCache:
+    """SQLite-backed store of signatures keyed by a hash of the article text."""
+
+    def __init__(self, path: str | Path = DEFAULT_CACHE_PATH) -> None:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(path))
+        self.conn.execute("CREATE TABLE IF NOT EXISTS signatures (key TEXT PRIMARY KEY, sig BLOB NOT NULL)")
+        self._pending: list[tuple[str, bytes]] = []
+
+    @staticmethod
+    def key(text: str, num_perm: int) -> str:
+        return f"{num_perm}:{hashlib.sha1(text.encode('utf-8')).hexdigest()}"
+
+    def get(self, key: str) -> array | None:
+        row = self.conn.execute("SELECT sig FROM signatures WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        sig = array("Q")
+        sig.frombytes(row[0])
+        return sig
+
+    def put(self, key: str, sig: array) -> None:
+        self._pending.append((key, sig.tobytes()))
+
+    def flush(self) -> None:
+        with self.conn:
+            self.conn.executemany("INSERT OR REPLACE INTO signatures (key, sig) VALUES (?, ?)", self._pending)
+        self._pending.clear()
+
+    def close(self) -> None:
+        self.flush()
+        self.conn.close()
+
+    def __enter__(self) -> SignatureCache:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def _find(parent: list[int], i: int) -> int:
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def find_near_duplicates(
+    articles: Sequence[dict[str, str]],
+    *,
+    threshold: float = DEFAULT_THRESHOLD,
+    num_perm: int = DEFAULT_NUM_PERM,
+    bands: int = DEFAULT_BANDS,
+    cache: SignatureCache | None = None,
+) -> list[list[int]]:
+    """Group near-duplicate articles (e.g. one wire story syndicated by many feeds).
+
+    Each article's title and summary get a MinHash signature. The signature is
+    split into `bands`, and articles sharing any band land in the same bucket,
+    so only articles within a bucket are compared. Work grows roughly linearly
+    with the number of articles instead of quadratically.
+
+    Returns groups of article indices (two or more per group), ordered by
+    their first member.
+    """
+    if num_perm % bands:
+        raise ValueError("num_perm must be a multiple of bands")
+    rows = num_perm // bands
+
+    signatures = []
+    for article in articles:
+        text = f"{article['title']}\n{article['summary']}"
+        key = SignatureCache.key(text, num_perm) if cache is not None else None
+        sig = cache.get(key) if cache is not None else None
+        if sig is None:
+            sig = minhash_signature(text, num_perm)
+            if cache is not None:
+                cache.put(key, sig)
+        signatures.append(sig)
+    if cache is not None:
+        cache.flush()
+
+    parent = list(range(len(articles)))
+    buckets: dict[tuple[int, bytes], int] = {}
+    for i, sig in enumerate(signatures):
+        if sig[0] == _EMPTY and sig.count(_EMPTY) == num_perm:
+            continue  # no text to compare
+        for band in range(bands):
+            bucket = (band, sig[band * rows:(band + 1) * rows].tobytes())
+            first = buckets.setdefault(bucket, i)
+            if first == i:
+                continue
+            root_i, root_first = _find(parent, i), _find(parent, first)
+            # Compare with the bucket's first member only, to stay linear.
+            if root_i != root_first and similarity(sig, signatures[first]) >= threshold:
+                parent[max(root_i, root_first)] = min(root_i, root_first)
+
+    groups: dict[int, list[int]] = {}
+    for i in range(len(articles)):
+        groups.setdefault(_find(parent, i), []).append(i)
+    return [members for members in groups.values() if len(members) > 1]
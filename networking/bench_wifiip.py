@@ -0,0 +1,173 @@
+"""Offline benchmark for wifiip.ping_sweep.
+
+Puts a stand-in `ping` first on PATH that simulates a network: each address
+is deterministically alive or dead (from --seed), live hosts answer after a
+per-host latency with some probe loss, and dead or lost probes hang until the
+sweep's timeout kills them, as a real ping does. The sweep is then run for
+every combination of network size and worker count, reporting wall time,
+probes per second, CPU time (this process plus the ping children) and how
+many of the simulated live hosts were found.
+
+POSIX only: the stand-in is a shell script, which Windows will not run as `ping`.
+
+Examples:
+    python bench_wifiip.py
+    python bench_wifiip.py --sizes 24,22 --workers 32,64,256 --timeout 0.5
+    python bench_wifiip.py --dead 0.9 --loss 0.1 --json results.json
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import resource
+import stat
+import sys
+import tempfile
+import time
+from typing import Optional
+
+import wifiip
+
+
+def simulate_network(
+    targets: list[str],
+    *,
+    dead: float,
+    latency: float,
+    jitter: float,
+    loss: float,
+    seed: int,
+    run: int = 0,
+) -> dict[str, Optional[float]]:
+    """Map each target to its reply delay in seconds, or None if it never answers.
+
+    Which hosts exist and their latencies depend only on `seed`; probe loss is
+    drawn again for every `run`.
+    """
+    lossy = random.Random(f"{seed}:run:{run}")
+    replies: dict[str, Optional[float]] = {}
+    for ip in targets:
+        host = random.Random(f"{seed}:{ip}")
+        alive = host.random() >= dead
+        delay = max(0.0, latency + host.uniform(-1.0, 1.0) * jitter)
+        replies[ip] = delay if alive and lossy.random() >= loss else None
+    return replies
+
+
+def install_fake_ping(directory: str, replies: dict[str, Optional[float]], hang_s: float) -> str:
+    """Write a stand-in `ping` answering per `replies` into `directory`.
+
+    It is a plain shell script (one exec of `sleep` per probe) rather than a
+    Python one, so the stand-in's own start-up cost does not swamp the CPU
+    figures or push live hosts past the sweep timeout.
+    """
+    path = os.path.join(directory, "ping")
+    lines = ["#!/bin/sh", "for ip; do :; done", 'case "$ip" in']
+    for ip, delay in replies.items():
+        if delay is not None:
+            lines.append(f"{ip}) exec sleep {delay:.4f} ;;")
+    # No reply: hang like a real ping until the sweep's timeout kills it.
+    lines += [f"*) exec sleep {hang_s:.1f} ;;", "esac", ""]
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines))
+    os.chmod(path, os.stat(path).st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    return path
+
+
+def _cpu_seconds() -> float:
+    total = 0.0
+    for who in (resource.RUSAGE_SELF, resource.RUSAGE_CHILDREN):
+        usage = resource.getrusage(who)
+        total += usage.ru_utime + usage.ru_stime
+    return total
+
+
+def run_sweep(network: str, workers: int, timeout_s: float) -> dict:
+    targets = len(wifiip._build_targets(network))
+    cpu_start = _cpu_seconds()
+    start = time.perf_counter()
+    # ping_sweep prints every host it finds; keep that out of the report.
+    with contextlib.redirect_stdout(io.StringIO()):
+        active = wifiip.ping_sweep(network, timeout_s=timeout_s, workers=workers)
+    elapsed = time.perf_counter() - start
+    cpu = _cpu_seconds() - cpu_start
+    return {
+        "network": network,
+        "workers": workers,
+        "timeout_s": timeout_s,
+        "probes": targets,
+        "active": len(active),
+        "wall_s": elapsed,
+        "probes_per_s": targets / elapsed,
+        "cpu_s": cpu,
+        "cpu_ms_per_probe": cpu / targets * 1000,
+    }
+
+
+def _int_list(value: str) -> list[int]:
+    return [int(part) for part in value.split(",") if part]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ping_sweep against a simulated network.")
+    parser.add_argument("--sizes", type=_int_list, default=[26, 24], help="CIDR prefix lengths to scan (default: 26,24).")
+    parser.add_argument("--workers", type=_int_list, default=[16, 64, 128], help="Worker counts to try (default: 16,64,128).")
+    parser.add_argument("--timeout", type=float, default=1.0, help="ping_sweep timeout in seconds (default: 1.0).")
+    parser.add_argument("--latency", type=float, default=0.02, help="Mean reply latency in seconds (default: 0.02).")
+    parser.add_argument("--jitter", type=float, default=0.01, help="Latency spread in seconds (default: 0.01).")
+    parser.add_argument("--loss", type=float, default=0.02, help="Probability that a probe to a live host is lost (default: 0.02).")
+    parser.add_argument("--dead", type=float, default=0.7, help="Fraction of addresses with no host (default: 0.7).")
+    parser.add_argument("--seed", type=int, default=1, help="Seed choosing which hosts are alive (default: 1).")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per combination; the fastest is reported (default: 1).")
+    parser.add_argument("--json", metavar="PATH", help="Also write the results as JSON to PATH.")
+    args = parser.parse_args()
+
+    if sys.platform == "win32":
+        raise SystemExit("The stand-in ping needs a POSIX system.")
+
+    config = {
+        "latency": args.latency,
+        "jitter": args.jitter,
+        "loss": args.loss,
+        "dead": args.dead,
+        "seed": args.seed,
+    }
+    # Longer than any sweep timeout, so unanswered probes are always killed.
+    hang_s = args.timeout + 5.0
+    results = []
+    with tempfile.TemporaryDirectory() as bin_dir:
+        os.environ["PATH"] = bin_dir + os.pathsep + os.environ.get("PATH", "")
+
+        print(
+            f"{'network':<16} {'workers':>7} {'probes':>6} {'active':>9} "
+            f"{'wall s':>8} {'probes/s':>9} {'CPU s':>7} {'CPU ms/probe':>12}"
+        )
+        for size in args.sizes:
+            network = f"10.0.0.0/{size}"
+            for workers in args.workers:
+                runs = []
+                for run in range(max(1, args.repeat)):
+                    replies = simulate_network(wifiip._build_targets(network), run=run, **config)
+                    install_fake_ping(bin_dir, replies, hang_s)
+                    result = run_sweep(network, workers, args.timeout)
+                    result["expected_active"] = sum(delay is not None for delay in replies.values())
+                    runs.append(result)
+                best = min(runs, key=lambda r: r["wall_s"])
+                results.append(best)
+                print(
+                    f"{network:<16} {workers:>7} {best['probes']:>6} "
+                    f"{best['active']:>4}/{best['expected_active']:<4} {best['wall_s']:>8.2f} "
+                    f"{best['probes_per_s']:>9.1f} {best['cpu_s']:>7.2f} {best['cpu_ms_per_probe']:>12.2f}"
+                )
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"config": config, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,10 @@
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
 import unittest
 from unittest.mock import patch
 
@@ -69,6 +76,10 @@ class TestWifiip(unittest.TestCase):
         table = wifiip._read_arp_table()
         self.assertEqual(table["192.168.1.1"], "aa:bb:cc:dd:ee:ff")
 
+    def test_mask_hostname(self):
+        self.assertEqual(wifiip._mask_hostname("alices-iphone.lan."), "x.lan")
+        self.assertEqual(wifiip._mask_hostname("printer"), "x")
+
     @patch("wifiip.subprocess.run")
     def test_ping_sweep_handles_missing_ping(self, run):
         def raise_fnf(*_args, **_kwargs):
@@ -79,5 +90,91 @@ class TestWifiip(unittest.TestCase):
             wifiip.ping_sweep("192.168.1", workers=1)
 
 
+class TestNameResolution(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache_path = os.path.join(tmp.name, "names.json")
+
+    def test_resolves_and_caches_names(self):
+        """Test that names and failed lookups are cached across runs."""
+        lookups = []
+
+        def lookup(ip):
+            lookups.append(ip)
+            if ip == "192.168.1.2":
+                raise socket.herror(1, "Unknown host")
+            return ("printer.lan", [], [ip])
+
+        resolver = wifiip.NameResolver(wifiip.HostnameCache(self.cache_path), lookup=lookup)
+        for ip in ("192.168.1.1", "192.168.1.2"):
+            resolver.submit(ip)
+        self.assertEqual(resolver.results(), {"192.168.1.1": "printer.lan", "192.168.1.2": None})
+        resolver.cache.save()
+
+        resolver = wifiip.NameResolver(wifiip.HostnameCache(self.cache_path), lookup=lookup)
+        for ip in ("192.168.1.1", "192.168.1.2"):
+            resolver.submit(ip)
+        self.assertEqual(resolver.results()["192.168.1.1"], "printer.lan")
+        self.assertEqual(len(lookups), 2)
+
+    def test_expired_entries_are_looked_up_again(self):
+        cache = wifiip.HostnameCache(self.cache_path, ttl_s=-1)
+        cache.put("192.168.1.1", "old.lan")
+        self.assertEqual(cache.get("192.168.1.1"), (False, None))
+
+    def test_slow_lookup_times_out(self):
+        """Test that a hung lookup is reported unnamed within the timeout."""
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        def lookup(ip):
+            if ip.endswith(".1"):
+                release.wait(5)
+            return ("fast.lan", [], [ip])
+
+        cache = wifiip.HostnameCache(None)
+        resolver = wifiip.NameResolver(cache, timeout_s=0.2, lookup=lookup)
+        resolver.submit("10.0.0.1")
+        resolver.submit("10.0.0.2")
+        start = time.monotonic()
+        names = resolver.results()
+
+        self.assertLess(time.monotonic() - start, 1.0)
+        self.assertEqual(names, {"10.0.0.1": None, "10.0.0.2": "fast.lan"})
+        self.assertEqual(cache.get("10.0.0.1"), (False, None))
+
+    def test_abandoned_lookup_does_not_delay_exit(self):
+        """Test that the process exits without waiting for a hung lookup."""
+        script = (
+            "import time, wifiip\n"
+            "resolver = wifiip.NameResolver(timeout_s=0.2, lookup=lambda ip: time.sleep(4))\n"
+            "resolver.submit('10.0.0.1')\n"
+            "assert resolver.results() == {'10.0.0.1': None}\n"
+        )
+        start = time.monotonic()
+        subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            check=True,
+            timeout=10,
+        )
+        self.assertLess(time.monotonic() - start, 2.0)
+
+    @patch("wifiip.subprocess.run")
+    def test_ping_sweep_reports_hosts_as_found(self, run):
+        class R:
+            def __init__(self, returncode):
+                self.returncode = returncode
+
+        run.side_effect = lambda cmd, **_kwargs: R(0 if cmd[-1].endswith((".3", ".5")) else 1)
+        found = []
+        with patch("builtins.print"):
+            active = wifiip.ping_sweep("192.168.1.0/29", workers=4, on_active=found.append)
+
+        self.assertEqual(active, ["192.168.1.3", "192.168.1.5"])
+        self.assertCountEqual(found, active)
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
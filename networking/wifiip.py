@@ -5,9 +5,19 @@ import platform
 import subprocess
 import argparse
 import ipaddress
+import json
+import os
+import queue
 import re
-from typing import Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Optional
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
+
+
+DEFAULT_NAME_CACHE = Path.home() / ".cache" / "pyusage" / "wifiip-names.json"
 
 
 def get_local_ip():
@@ -34,6 +44,14 @@ def _mask_ip(ip: str) -> str:
     return "x.x.x.x"
 
 
+def _mask_hostname(name: str) -> str:
+    # Hide the device-specific first label, keep the (shared) domain.
+    labels = name.rstrip(".").split(".")
+    if len(labels) > 1:
+        return ".".join(["x"] + labels[1:])
+    return "x"
+
+
 def _build_targets(network_prefix_or_cidr: str, *, max_hosts: int = 4096) -> list[str]:
     """Return a list of IPv4 target strings.
 
@@ -161,13 +179,172 @@ def _read_arp_table() -> dict[str, str]:
     return table
 
 
+class HostnameCache:
+    """Persistent IP -> hostname cache with per-entry expiry.
+
+    Failed lookups (no PTR record) are cached too, for `negative_ttl_s`, so
+    hosts without a name are not re-queried on every scan. The cache is a
+    small JSON file readable only by the current user.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = DEFAULT_NAME_CACHE,
+        *,
+        ttl_s: float = 3600.0,
+        negative_ttl_s: float = 300.0,
+    ) -> None:
+        self.path = Path(path) if path is not None else None
+        self.ttl_s = ttl_s
+        self.negative_ttl_s = negative_ttl_s
+        self._lock = threading.Lock()
+        self._entries: dict[str, list] = {}
+        self._dirty = False
+        if self.path is not None:
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    self._entries = json.load(f)
+            except (OSError, ValueError):
+                self._entries = {}
+
+    def get(self, ip: str) -> tuple[bool, Optional[str]]:
+        """Return (hit, name); name is None for a cached failed lookup."""
+        with self._lock:
+            entry = self._entries.get(ip)
+        if entry is None or entry[1] < time.time():
+            return False, None
+        return True, entry[0]
+
+    def put(self, ip: str, name: Optional[str]) -> None:
+        ttl = self.ttl_s if name is not None else self.negative_ttl_s
+        with self._lock:
+            self._entries[ip] = [name, time.time() + ttl]
+            self._dirty = True
+
+    def save(self) -> None:
+        if self.path is None or not self._dirty:
+            return
+        now = time.time()
+        with self._lock:
+            entries = {ip: entry for ip, entry in self._entries.items() if entry[1] >= now}
+            self._dirty = False
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=".wifiip-names-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entries, f)
+            os.replace(tmp, self.path)
+        except OSError:
+            os.unlink(tmp)
+            raise
+
+
+class NameResolver:
+    """Reverse-DNS (PTR) lookups run on worker threads alongside the sweep.
+
+    Call `submit` for each live host as it is found, then `results` once the
+    sweep is done. Lookups still running `timeout_s` after they were started
+    are reported as unnamed (and not cached), so one slow resolver cannot
+    stall the scan. The workers are daemon threads: a lookup abandoned in the
+    system resolver does not keep the process from exiting either.
+    """
+
+    def __init__(
+        self,
+        cache: Optional[HostnameCache] = None,
+        *,
+        timeout_s: float = 1.0,
+        workers: int = 16,
+        lookup: Callable[[str], tuple] = socket.gethostbyaddr,
+    ) -> None:
+        self.cache = cache if cache is not None else HostnameCache(None)
+        self.timeout_s = timeout_s
+        self._lookup = lookup
+        self._max_workers = max(1, workers)
+        self._threads: list[threading.Thread] = []
+        self._jobs: queue.SimpleQueue = queue.SimpleQueue()
+        self._pending: dict[str, Future] = {}
+        self._started: dict[str, float] = {}
+        self._names: dict[str, Optional[str]] = {}
+
+    def _resolve(self, ip: str) -> Optional[str]:
+        self._started[ip] = time.monotonic()
+        try:
+            name = self._lookup(ip)[0]
+        except (socket.herror, UnicodeError):
+            # Definite answer: no usable PTR record.
+            name = None
+        except OSError:
+            # Resolver failure; try again on the next scan.
+            return None
+        self.cache.put(ip, name)
+        return name
+
+    def _work(self) -> None:
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            ip, fut = job
+            if not fut.set_running_or_notify_cancel():
+                continue
+            try:
+                fut.set_result(self._resolve(ip))
+            except BaseException as e:
+                fut.set_exception(e)
+
+    def submit(self, ip: str) -> None:
+        if ip in self._names or ip in self._pending:
+            return
+        hit, name = self.cache.get(ip)
+        if hit:
+            self._names[ip] = name
+            return
+        fut: Future = Future()
+        self._pending[ip] = fut
+        self._jobs.put((ip, fut))
+        if len(self._threads) < min(self._max_workers, len(self._pending)):
+            thread = threading.Thread(target=self._work, name="wifiip-names", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def results(self) -> dict[str, Optional[str]]:
+        """Wait for outstanding lookups (each up to `timeout_s`) and return ip -> name."""
+        begin = time.monotonic()
+        while self._pending:
+            # A lookup still queued behind busy workers is timed from now.
+            deadline = min(self._started.get(ip, begin) for ip in self._pending) + self.timeout_s
+            remaining = max(0.0, deadline - time.monotonic())
+            done, _ = wait(self._pending.values(), timeout=remaining, return_when="FIRST_COMPLETED")
+            now = time.monotonic()
+            for ip, fut in list(self._pending.items()):
+                if fut in done:
+                    self._names[ip] = fut.result()
+                    del self._pending[ip]
+                elif now - self._started.get(ip, begin) >= self.timeout_s:
+                    fut.cancel()  # skipped by the workers if not yet started
+                    self._names[ip] = None
+                    del self._pending[ip]
+        # Idle workers exit; ones stuck in the system resolver are daemons
+        # and are abandoned.
+        for _ in self._threads:
+            self._jobs.put(None)
+        return dict(self._names)
+
+
 def ping_sweep(
     network: str,
     *,
     reveal: bool = False,
     timeout_s: float = 1.5,
     workers: int = 64,
+    on_active: Optional[Callable[[str], None]] = None,
 ) -> list[str]:
+    """Ping every host in `network` and return the responsive IPs, sorted.
+
+    `on_active` is called with each responsive IP as soon as it answers, so
+    follow-up work (such as name lookups) can overlap the rest of the sweep.
+    """
     # Determine the operating system
     param = "-n" if platform.system().lower() == "windows" else "-c"
 
@@ -198,6 +375,8 @@ def ping_sweep(
                 ip = fut.result()
                 if ip:
                     active_ips.append(ip)
+                    if on_active is not None:
+                        on_active(ip)
                     if reveal:
                         print(f"Active IP: {ip}")
                     else:
@@ -242,6 +421,29 @@ def main():
         action="store_true",
         help="After scanning, show MAC addresses from the OS ARP cache.",
     )
+    parser.add_argument(
+        "--names",
+        action="store_true",
+        help="Resolve hostnames (reverse DNS) of active hosts while scanning.",
+    )
+    parser.add_argument(
+        "--names-timeout",
+        type=float,
+        default=1.0,
+        help="Give up on a hostname lookup after this many seconds (default: 1.0).",
+    )
+    parser.add_argument(
+        "--names-ttl",
+        type=float,
+        default=3600.0,
+        help="Reuse cached hostnames for this many seconds (default: 3600).",
+    )
+    parser.add_argument(
+        "--names-cache",
+        type=Path,
+        default=DEFAULT_NAME_CACHE,
+        help=f"Hostname cache file (default: {DEFAULT_NAME_CACHE}).",
+    )
     args = parser.parse_args()
 
     local_ip = get_local_ip()
@@ -258,12 +460,18 @@ def main():
         print("Local IP Address:", _mask_ip(local_ip))
         print("Scanning for active hosts (IPs hidden)...")
 
+    resolver: Optional[NameResolver] = None
+    if args.names:
+        cache = HostnameCache(args.names_cache, ttl_s=args.names_ttl)
+        resolver = NameResolver(cache, timeout_s=args.names_timeout)
+
     try:
         active_ips = ping_sweep(
             network_prefix,
             reveal=args.reveal,
             timeout_s=args.timeout,
             workers=args.workers,
+            on_active=resolver.submit if resolver is not None else None,
         )
     except ValueError as e:
         raise SystemExit(f"Invalid --network value: {e}") from e
@@ -276,6 +484,23 @@ def main():
         print("Active hosts found:", len(active_ips))
         print("Active host last octets:", [_last_octet(ip) for ip in active_ips])
 
+    if resolver is not None:
+        names = resolver.results()
+        try:
+            resolver.cache.save()
+        except OSError as e:
+            print(f"Could not save hostname cache: {e}")
+        if active_ips:
+            print("Hostnames:" if args.reveal else "Hostnames (masked):")
+        for ip in active_ips:
+            name = names.get(ip)
+            if not name:
+                continue
+            if args.reveal:
+                print(f"  {ip} -> {name}")
+            else:
+                print(f"  .{_last_octet(ip)} -> {_mask_hostname(name)}")
+
     if args.arp and active_ips:
         try:
             arp = _read_arp_table()
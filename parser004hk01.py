@@ -1,18 +1,21 @@
 from __future__ import annotations
 
+import argparse
 from urllib.parse import unquote, urljoin
 
-import requests
-from bs4 import BeautifulSoup
+import httpfetch
+from lazyimport import lazy_import
 
+bs4 = lazy_import("bs4")
 
-def fetch_and_parse(session: requests.Session, url: str) -> BeautifulSoup:
-    response = session.get(url, timeout=15)
+
+def fetch_and_parse(fetcher: httpfetch.Fetcher, url: str) -> bs4.BeautifulSoup:
+    response = fetcher.get(url, timeout=15)
     response.raise_for_status()
-    return BeautifulSoup(response.content, "html.parser")
+    return bs4.BeautifulSoup(response.content, "html.parser")
 
 
-def extract_and_decode_links(soup: BeautifulSoup, base_url: str) -> list[str]:
+def extract_and_decode_links(soup: bs4.BeautifulSoup, base_url: str) -> list[str]:
     links: list[str] = []
     # select('a[href]') is a bit faster than find_all with kwargs.
     for a_tag in soup.select("a[href]"):
@@ -25,10 +28,11 @@ def extract_and_decode_links(soup: BeautifulSoup, base_url: str) -> list[str]:
 
 
 def main() -> None:
-    url = "https://www.scmp.com"
-    with requests.Session() as session:
-        session.headers.update({"User-Agent": "pyusage/1.0"})
-        soup = fetch_and_parse(session, url)
+    parser = argparse.ArgumentParser(description="List the decoded links found on a web page")
+    parser.add_argument("url", nargs="?", default="https://www.scmp.com", help="Page to scan (default: https://www.scmp.com)")
+    url = parser.parse_args().url
+
+    soup = fetch_and_parse(httpfetch.get_fetcher(), url)
     links = extract_and_decode_links(soup, url)
 
     # Display links in chronological order (order of appearance)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import re
+import sys
+from collections.abc import Iterable, Iterator
 
 
 _RE_IF = re.compile(r"^if\s+(.*):\s*$")
@@ -16,13 +18,19 @@ def _indent_width(line: str) -> int:
 	return len(line) - len(line.lstrip(" \t"))
 
 
-def translate_python_to_javascript(python_code: str) -> str:
-	out: list[str] = []
+def translate_lines(lines: Iterable[str]) -> Iterator[str]:
+	"""Translate Python source line by line, yielding JavaScript lines.
+
+	`lines` may be any iterable of strings, including an open text file; trailing
+	newlines are ignored. Only the stack of open block indents is kept, so memory
+	use does not grow with the size of the input.
+	"""
 	block_indents: list[int] = []
 
-	for raw_line in python_code.splitlines():
+	for raw_line in lines:
+		raw_line = raw_line.rstrip("\r\n")
 		if not raw_line.strip():
-			out.append("")
+			yield ""
 			continue
 
 		indent = _indent_width(raw_line)
@@ -31,37 +39,37 @@ def translate_python_to_javascript(python_code: str) -> str:
 		# Close blocks when indentation decreases.
 		while block_indents and indent < block_indents[-1]:
 			block_indents.pop()
-			out.append("}" )
+			yield "}"
 
 		if line.startswith("#"):
-			out.append("//" + line[1:])
+			yield "//" + line[1:]
 			continue
 
 		# print(...) -> console.log(...)
 		if line.startswith("print("):
-			out.append("console.log" + line[len("print"):])
+			yield "console.log" + line[len("print"):]
 			continue
 
 		m = _RE_ELIF.match(line)
 		if m:
-			out.append(f"else if ({m.group(1)}) {{")
+			yield f"else if ({m.group(1)}) {{"
 			block_indents.append(indent + 1)
 			continue
 
 		if _RE_ELSE.match(line):
-			out.append("else {")
+			yield "else {"
 			block_indents.append(indent + 1)
 			continue
 
 		m = _RE_IF.match(line)
 		if m:
-			out.append(f"if ({m.group(1)}) {{")
+			yield f"if ({m.group(1)}) {{"
 			block_indents.append(indent + 1)
 			continue
 
 		m = _RE_WHILE.match(line)
 		if m:
-			out.append(f"while ({m.group(1)}) {{")
+			yield f"while ({m.group(1)}) {{"
 			block_indents.append(indent + 1)
 			continue
 
@@ -78,21 +86,44 @@ def translate_python_to_javascript(python_code: str) -> str:
 
 			# Simple direction assumption for step (keeps this lightweight).
 			cmp_op = "<" if not step.startswith("-") else ">"
-			out.append(f"for (let {var} = {start}; {var} {cmp_op} {end}; {var} += {step}) {{")
+			yield f"for (let {var} = {start}; {var} {cmp_op} {end}; {var} += {step}) {{"
 			block_indents.append(indent + 1)
 			continue
 
 		# Fallback: pass through.
-		out.append(line)
+		yield line
 
 	while block_indents:
 		block_indents.pop()
-		out.append("}")
+		yield "}"
+
+
+def translate_python_to_javascript(python_code: str) -> str:
+	return "\n".join(translate_lines(python_code.splitlines()))
 
-	return "\n".join(out)
+
+def translate_file(src: str, dst: str | None = None) -> None:
+	"""Stream-translate the Python file `src` to `dst` (stdout when omitted)."""
+	with open(src, encoding="utf-8") as fin:
+		if dst is None:
+			_write_lines(translate_lines(fin), sys.stdout)
+			return
+		with open(dst, "w", encoding="utf-8") as fout:
+			_write_lines(translate_lines(fin), fout)
+
+
+def _write_lines(lines: Iterable[str], out) -> None:
+	for line in lines:
+		out.write(line)
+		out.write("\n")
 
 
 def main() -> None:
+	# Usage: pytojsinterpret.py [input.py [output.js]]
+	if len(sys.argv) > 1:
+		translate_file(sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else None)
+		return
+
 	python_script = """\
 # This is a comment
 print("Hello, World!")
@@ -1,14 +1,28 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import math
+import os
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from typing import NamedTuple, Optional, Union
+from urllib.parse import urlparse
 try:
     from typing import TypedDict
 except ImportError:
     from typing_extensions import TypedDict
 
+import httpfetch
+import metrics
+from article_store import ArticleBatch
+from lazyimport import lazy_import
+from summary_text import clean_summary
+
 try:
-    import feedparser
+    # feedparser is loaded on first use so that --help stays fast.
+    feedparser = lazy_import("feedparser")
 except ImportError:
     print("Error: feedparser is not installed.")
     print("Please install it using: pip install feedparser")
@@ -23,16 +37,55 @@ class Article(TypedDict):
     summary: str
 
 
-def parse_rss_feed(feed_url: str) -> list[Article]:
+class FeedResult(NamedTuple):
+    feed_url: str
+    articles: Optional[Union[list[Article], ArticleBatch]]
+    error: Optional[str]
+
+
+def _fetch_feed(feed_url: str) -> tuple[str | bytes, dict[str, str]]:
+    """Download an http(s) feed through the shared fetcher.
+
+    Returns the document and the response headers feedparser uses for charset
+    detection and relative links. Anything else (a local path or raw XML) is
+    handed to feedparser unchanged.
+    """
+    if urlparse(feed_url).scheme not in ("http", "https"):
+        return feed_url, {}
+    response = httpfetch.get_fetcher().get(feed_url)
+    response.raise_for_status()
+    headers = {name.lower(): value for name, value in response.headers.items()}
+    headers.setdefault("content-location", response.url)
+    return response.content, headers
+
+
+def parse_rss_feed(
+    feed_url: str,
+    *,
+    as_batch: bool = False,
+    summary_chars: Optional[int] = None,
+    summary_sentences: Optional[int] = None,
+    raw_summary: bool = False,
+) -> Union[list[Article], ArticleBatch]:
     """Parse an RSS feed and extract article information.
     
     Args:
         feed_url: URL of the RSS feed to parse
+        as_batch: Return a compact columnar ArticleBatch instead of a list of
+            dicts (iterating or indexing the batch still yields Article dicts)
+        summary_chars: Truncate summaries to this many characters
+        summary_sentences: Truncate summaries to this many sentences
+        raw_summary: Keep the summary HTML as published instead of reducing
+            it to plain text (the limits above are then ignored)
         
     Returns:
         List of articles with title, link, published date, and summary
     """
-    feed = feedparser.parse(feed_url)
+    m = metrics.current()
+    with m.timer("fetch", url=feed_url):
+        source, headers = _fetch_feed(feed_url)
+    with m.timer("parse", url=feed_url):
+        feed = feedparser.parse(source, response_headers=headers)
     
     # Check for feed errors
     if hasattr(feed, 'bozo') and feed.bozo:
@@ -40,6 +93,7 @@ def parse_rss_feed(feed_url: str) -> list[Article]:
             raise Exception(f"Feed parsing error: {feed.bozo_exception}")
     
     articles: list[Article] = []
+    batch = ArticleBatch() if as_batch else None
     
     for entry in feed.entries:
         # Extract published date, fallback to current date if not available
@@ -54,6 +108,12 @@ def parse_rss_feed(feed_url: str) -> list[Article]:
         
         # Extract summary, fallback to description or empty string
         summary = entry.get("summary", entry.get("description", ""))
+        if not raw_summary:
+            summary = clean_summary(summary, summary_chars, summary_sentences)
+        
+        if batch is not None:
+            batch.append(entry.get("title", "No title"), entry.get("link", ""), published, summary, feed_url)
+            continue
         
         article: Article = {
             "title": entry.get("title", "No title"),
@@ -63,9 +123,87 @@ def parse_rss_feed(feed_url: str) -> list[Article]:
         }
         articles.append(article)
     
+    if batch is not None:
+        m.inc("pyusage_articles_total", len(batch), url=feed_url)
+        return batch
+    m.inc("pyusage_articles_total", len(articles), url=feed_url)
     return articles
 
 
+def _parse_feed_shard(
+    feed_urls: list[str],
+    collect_metrics: bool = False,
+    **options,
+) -> tuple[list[tuple[str, Optional[ArticleBatch], Optional[str]]], Optional[dict]]:
+    """Parse a shard of feeds in a worker process.
+
+    Articles come back as ArticleBatch objects rather than dicts (or feedparser
+    objects) to keep the data pickled back to the parent small. `options` are
+    passed on to parse_rss_feed. With `collect_metrics` the shard is recorded
+    in a fresh registry whose `to_dict()` is returned for the parent to merge;
+    otherwise None is returned in its place.
+    """
+    m = metrics.enable() if collect_metrics else None
+    results = []
+    for feed_url in feed_urls:
+        try:
+            batch = parse_rss_feed(feed_url, as_batch=True, **options)
+        except Exception as exc:
+            results.append((feed_url, None, str(exc)))
+            continue
+        results.append((feed_url, batch, None))
+    if m is None:
+        return results, None
+    metrics.disable()
+    return results, m.to_dict()
+
+
+def iter_rss_feeds(
+    feed_urls: list[str],
+    *,
+    processes: int = 1,
+    shard_size: Optional[int] = None,
+    as_batch: bool = False,
+    **options,
+) -> Iterator[FeedResult]:
+    """Parse many feeds, yielding one FeedResult per feed in input order.
+
+    With `processes` > 1 the feeds are split into shards and parsed in a process
+    pool, so feedparser's CPU-bound work runs on several cores. `processes=0`
+    uses every CPU. Results are yielded as soon as their shard (and every
+    earlier shard) is done. `as_batch` yields ArticleBatch objects instead of
+    lists of dicts. Other keyword `options` (such as `summary_chars`) are
+    passed on to parse_rss_feed. Metrics recorded in the worker processes are
+    merged into this process's registry.
+    """
+    if processes == 0:
+        processes = os.cpu_count() or 1
+    if processes <= 1 or len(feed_urls) <= 1:
+        for feed_url in feed_urls:
+            try:
+                yield FeedResult(feed_url, parse_rss_feed(feed_url, as_batch=as_batch, **options), None)
+            except Exception as exc:
+                yield FeedResult(feed_url, None, str(exc))
+        return
+
+    if shard_size is None:
+        # A few shards per worker keeps the pool busy when feed sizes vary.
+        shard_size = max(1, math.ceil(len(feed_urls) / (processes * 4)))
+    shards = [feed_urls[i:i + shard_size] for i in range(0, len(feed_urls), shard_size)]
+
+    registry = metrics.current()
+    parse_shard = functools.partial(_parse_feed_shard, collect_metrics=registry.enabled, **options)
+    with ProcessPoolExecutor(max_workers=min(processes, len(shards))) as pool:
+        for shard, recorded in pool.map(parse_shard, shards):
+            if recorded is not None:
+                registry.merge(recorded)
+            for feed_url, batch, error in shard:
+                if batch is None:
+                    yield FeedResult(feed_url, None, error)
+                else:
+                    yield FeedResult(feed_url, batch if as_batch else batch.as_dicts(), None)
+
+
 def format_article(article: Article, index: int) -> str:
     """Format an article for display.
     
@@ -89,6 +227,23 @@ def format_article(article: Article, index: int) -> str:
     return "\n".join(lines)
 
 
+def print_near_duplicates(articles: list[Article], cache_path: Optional[str] = None) -> None:
+    """Print groups of near-duplicate articles found across feeds."""
+    import near_dupes
+
+    with near_dupes.SignatureCache(cache_path or near_dupes.DEFAULT_CACHE_PATH) as cache:
+        with metrics.current().timer("dedupe"):
+            groups = near_dupes.find_near_duplicates(articles, cache=cache)
+    
+    print(f"\n{'#' * 80}")
+    print(f"Near-duplicate groups: {len(groups)}")
+    print(f"{'#' * 80}")
+    for number, group in enumerate(groups, start=1):
+        print(f"\nGroup {number} ({len(group)} articles):")
+        for i in group:
+            print(f"  - {articles[i]['title']} ({articles[i]['link']})")
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Parse daily news articles from RSS feeds and extract summaries"
@@ -104,32 +259,84 @@ def main() -> None:
         default=10,
         help="Maximum number of articles to display per feed (default: 10)",
     )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=1,
+        help="Parse feeds in this many worker processes; 0 uses every CPU (default: 1)",
+    )
+    parser.add_argument(
+        "--summary-chars",
+        type=int,
+        default=500,
+        help="Truncate each summary to this many characters; 0 keeps the full text (default: 500)",
+    )
+    parser.add_argument(
+        "--summary-sentences",
+        type=int,
+        default=None,
+        help="Truncate each summary to this many sentences",
+    )
+    parser.add_argument(
+        "--raw-summary",
+        action="store_true",
+        help="Print summaries as published (HTML included) instead of as plain text",
+    )
+    parser.add_argument(
+        "--near-dupes",
+        action="store_true",
+        help="After parsing, group near-duplicate articles (syndicated copies) across all feeds",
+    )
+    parser.add_argument(
+        "--signature-cache",
+        default=None,
+        help="SQLite file caching similarity signatures between runs "
+        "(default: ~/.cache/pyusage/signatures.db)",
+    )
+    metrics.add_metrics_argument(parser)
     
     args = parser.parse_args()
+    m = metrics.enable() if args.metrics_out else metrics.current()
+    all_articles: list[Article] = []
     
-    for feed_url in args.feed_urls:
+    feeds = iter_rss_feeds(
+        args.feed_urls,
+        processes=args.processes,
+        summary_chars=args.summary_chars or None,
+        summary_sentences=args.summary_sentences,
+        raw_summary=args.raw_summary,
+    )
+    for feed_url, articles, error in feeds:
         print(f"\n{'#' * 80}")
         print(f"Fetching articles from: {feed_url}")
         print(f"{'#' * 80}")
         
-        try:
-            articles = parse_rss_feed(feed_url)
-            
-            if not articles:
-                print("No articles found in this feed.")
-                continue
-            
-            # Limit the number of articles to display
-            articles_to_show = articles[:args.limit]
-            
+        if error is not None:
+            print(f"Error parsing feed {feed_url}: {error}")
+            continue
+        
+        if not articles:
+            print("No articles found in this feed.")
+            continue
+        
+        if args.near_dupes:
+            all_articles.extend(articles)
+        
+        # Limit the number of articles to display
+        articles_to_show = articles[:args.limit]
+        
+        with m.timer("output", url=feed_url):
             for idx, article in enumerate(articles_to_show, start=1):
                 print(format_article(article, idx))
-            
-            if len(articles) > args.limit:
-                print(f"\n... and {len(articles) - args.limit} more articles")
-                
-        except Exception as exc:
-            print(f"Error parsing feed {feed_url}: {exc}")
+        
+        if len(articles) > args.limit:
+            print(f"\n... and {len(articles) - args.limit} more articles")
+    
+    if args.near_dupes:
+        print_near_duplicates(all_articles, args.signature_cache)
+    
+    if args.metrics_out:
+        m.write(args.metrics_out)
 
 
 if __name__ == "__main__":
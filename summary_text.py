@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import re
+from html.parser import HTMLParser
+from typing import Optional
+
+
+ELLIPSIS = "\u2026"
+
+# Markup is fed to the parser this many characters at a time, so once the
+# limit is reached at most one chunk past it is ever tokenized.
+_CHUNK_SIZE = 4096
+
+_SKIPPED_TAGS = frozenset({"script", "style", "noscript", "template", "head", "title"})
+# Tags that separate words even when the markup has no whitespace around them.
+_BREAK_TAGS = frozenset({
+    "address", "article", "aside", "blockquote", "br", "dd", "div", "dl", "dt",
+    "figcaption", "figure", "footer", "h1", "h2", "h3", "h4", "h5", "h6", "header",
+    "hr", "li", "ol", "p", "pre", "section", "table", "td", "th", "tr", "ul",
+})
+_SPACE_RE = re.compile(r"\s+")
+# A sentence ends at . ! or ? followed by whitespace, or at a full-width
+# (CJK) terminator, optionally followed by closing quotes or brackets. A
+# period after a lone capital ("U.S.", "J. Smith") is taken as an initial.
+_SENTENCE_END_RE = re.compile("(?:(?:(?<!\\b[A-Z])\\.|[!?])[\"'\u2019\u201d)]*(?=\\s|$)|[\u3002\uff01\uff1f][\u300d\u300f\uff09\u201d]*)")
+
+
+class _Done(Exception):
+    pass
+
+
+class _TextExtractor(HTMLParser):
+    """Collects the visible text of an HTML fragment, whitespace-collapsed."""
+
+    def __init__(self, max_chars: Optional[int], max_sentences: Optional[int]) -> None:
+        super().__init__(convert_charrefs=True)
+        self.max_chars = max_chars
+        self.max_sentences = max_sentences
+        self.parts: list[str] = []
+        self.length = 0
+        self.sentences = 0
+        self.truncated = False
+        # The text so far ends in ".", "!" or "?": a sentence end only if the
+        # next text starts with a space (data pieces also end at chunk
+        # boundaries, e.g. between "3." and "5 percent").
+        self._held_end = False
+        self._skip_depth = 0
+        self._pending_space = False
+
+    def handle_starttag(self, tag: str, attrs: list) -> None:
+        if tag in _SKIPPED_TAGS:
+            self._skip_depth += 1
+        elif tag in _BREAK_TAGS:
+            self._pending_space = True
+
+    def handle_startendtag(self, tag: str, attrs: list) -> None:
+        if tag in _BREAK_TAGS:
+            self._pending_space = True
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in _SKIPPED_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag in _BREAK_TAGS:
+            self._pending_space = True
+
+    def handle_data(self, data: str) -> None:
+        if self._skip_depth:
+            return
+        text = _SPACE_RE.sub(" ", data)
+        if not text:
+            return
+        if text[0] == " ":
+            self._pending_space = True
+            text = text[1:]
+        trailing_space = text.endswith(" ")
+        text = text.rstrip(" ")
+        if text:
+            if self._pending_space and self.length:
+                self._append(" ")
+            self._pending_space = False
+            self._append(text)
+        if trailing_space:
+            self._pending_space = True
+
+    def _append(self, text: str) -> None:
+        if self.max_sentences is not None:
+            if self._held_end:
+                self._held_end = False
+                if text[0] == " ":
+                    self.sentences += 1
+                    if self.sentences >= self.max_sentences:
+                        self.truncated = True
+                        raise _Done
+            for match in _SENTENCE_END_RE.finditer(text):
+                if match.end() == len(text) and text[match.start()] in ".!?":
+                    self._held_end = True
+                    break
+                self.sentences += 1
+                if self.sentences >= self.max_sentences:
+                    text = text[:match.end()]
+                    self.truncated = True
+                    break
+        if self.max_chars is not None and self.length + len(text) > self.max_chars:
+            text = text[:self.max_chars - self.length + 1]
+            self.truncated = True
+        self.parts.append(text)
+        self.length += len(text)
+        if self.truncated:
+            raise _Done
+
+
+def clean_summary(
+    markup: str,
+    max_chars: Optional[int] = None,
+    max_sentences: Optional[int] = None,
+) -> str:
+    """Turn an HTML summary into plain text, optionally truncated.
+
+    Tags are dropped (along with the contents of script and style elements),
+    entities are decoded and whitespace is collapsed. With `max_chars` the text
+    is cut at a word boundary and ends with an ellipsis (counted in the limit);
+    with `max_sentences`
+    it stops after that many sentences. The markup is tokenized incrementally
+    and parsing stops as soon as a limit is hit, so the cost depends on the
+    limit rather than on the size of the fragment.
+    """
+    if max_chars is not None and max_chars < 1:
+        raise ValueError("max_chars must be at least 1")
+    if max_sentences is not None and max_sentences < 1:
+        raise ValueError("max_sentences must be at least 1")
+    if "<" not in markup and "&" not in markup and max_chars is None and max_sentences is None:
+        return _SPACE_RE.sub(" ", markup).strip()
+
+    extractor = _TextExtractor(max_chars, max_sentences)
+    try:
+        for start in range(0, len(markup), _CHUNK_SIZE):
+            extractor.feed(markup[start:start + _CHUNK_SIZE])
+        extractor.close()
+    except _Done:
+        pass
+
+    text = "".join(extractor.parts)
+    if max_chars is not None and len(text) > max_chars:
+        # Keep one character back for the ellipsis.
+        cut = text.rfind(" ", 0, max_chars)
+        # Fall back to a hard cut for long words and unspaced (CJK) text.
+        text = text[:cut if cut > max_chars // 2 else max_chars - 1].rstrip() + ELLIPSIS
+    return text.strip()
@@ -0,0 +1,100 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+import adstxt_validate as v
+
+
+SELLERS = {
+	"sellers": [
+		{"seller_id": "pub-1", "seller_type": "PUBLISHER", "domain": "example.com"},
+		{"seller_id": "pub-2", "seller_type": "PUBLISHER", "domain": "other.com"},
+		{"seller_id": "int-1", "seller_type": "INTERMEDIARY", "domain": "reseller.net"},
+		{"seller_id": "both-1", "seller_type": "BOTH", "is_confidential": 1},
+	]
+}
+
+ADS_TXT = """\
+# ads.txt for example.com
+contact=ads@example.com
+OWNERDOMAIN=example.org
+google.com, pub-1, DIRECT, f08c47fec0942fa0
+Google.com, int-1, RESELLER  # trailing comment
+google.com, both-1, DIRECT
+google.com, pub-9, DIRECT
+google.com, int-1, DIRECT
+google.com, pub-1, RESELLER
+google.com, pub-2, DIRECT
+unknown-ssp.com, 123, DIRECT
+google.com, pub-1
+"""
+
+
+class TestValidateAdsTxt(unittest.TestCase):
+	def setUp(self):
+		tmp = tempfile.TemporaryDirectory()
+		self.addCleanup(tmp.cleanup)
+		self.root = Path(tmp.name)
+		(self.root / "sellers").mkdir()
+		(self.root / "sellers" / "google.com.json").write_text(json.dumps(SELLERS), encoding="utf-8")
+		self.index = v.load_seller_index(self.root / "sellers")
+
+	def test_parse_skips_comments_and_reads_variables(self):
+		parsed = list(v.parse_ads_txt(ADS_TXT.splitlines()))
+		self.assertEqual(parsed[0], ("variable", ("CONTACT", "ads@example.com")))
+		self.assertEqual(parsed[3], ("record", v.AdsRecord(5, "google.com", "int-1", "RESELLER", "")))
+		self.assertEqual(parsed[-1], ("invalid", (12, "google.com, pub-1")))
+
+	def test_record_statuses(self):
+		"""Test each classification against the sellers.json index."""
+		report = v.validate_ads_txt("example.com", ADS_TXT.splitlines(), self.index)
+		statuses = {problem["line"]: problem["status"] for problem in report["problems"]}
+
+		self.assertEqual(statuses, {
+			7: v.UNAUTHORIZED,
+			8: v.RELATIONSHIP_MISMATCH,
+			9: v.RELATIONSHIP_MISMATCH,
+			10: v.DOMAIN_MISMATCH,
+			11: v.UNVERIFIABLE,
+			12: v.INVALID,
+		})
+		self.assertEqual(report["records"], 9)
+		self.assertEqual(report["counts"][v.OK], 3)
+
+	def test_owner_domain_counts_as_publisher(self):
+		"""Test that a seller on the OWNERDOMAIN is accepted as DIRECT."""
+		lines = ["google.com, pub-1, DIRECT", "OWNERDOMAIN=example.com"]
+		report = v.validate_ads_txt("brand-site.com", lines, self.index)
+		self.assertEqual(report["counts"], {v.OK: 1})
+
+	def test_byte_order_marks_are_ignored(self):
+		"""Test that sellers.json and ads.txt files starting with a UTF-8 BOM are read."""
+		sellers = {"sellers": [{"seller_id": "1", "seller_type": "PUBLISHER", "domain": "example.com"}]}
+		(self.root / "sellers" / "appnexus.com.json").write_text(json.dumps(sellers), encoding="utf-8-sig")
+		ads_dir = self.root / "ads"
+		ads_dir.mkdir()
+		(ads_dir / "example.com.txt").write_text("appnexus.com, 1, DIRECT\n", encoding="utf-8-sig")
+
+		index = v.load_seller_index(self.root / "sellers")
+		report = next(v.validate_directory(ads_dir, index))
+
+		self.assertIn("appnexus.com", index)
+		self.assertEqual(report["counts"], {v.OK: 1})
+
+	def test_process_pool_matches_in_process(self):
+		"""Test that pooled validation returns the same reports in name order."""
+		ads_dir = self.root / "ads"
+		ads_dir.mkdir()
+		for n in range(6):
+			(ads_dir / f"site{n}.com.txt").write_text(ADS_TXT, encoding="utf-8")
+
+		sequential = list(v.validate_directory(ads_dir, self.index))
+		pooled = list(v.validate_directory(ads_dir, self.index, processes=2, chunksize=2))
+
+		self.assertEqual(pooled, sequential)
+		self.assertEqual([report["domain"] for report in pooled], [f"site{n}.com" for n in range(6)])
+
+
+if __name__ == "__main__":
+	unittest.main(verbosity=2)
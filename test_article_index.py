@@ -0,0 +1,106 @@
+import os
+import tempfile
+import unittest
+
+import article_index
+
+
+def _article(i, title, summary=""):
+    return {
+        "title": title,
+        "link": f"https://news.example.com/{i}",
+        "published": "2026-01-13T10:00:00",
+        "summary": summary,
+    }
+
+
+class TestTokenize(unittest.TestCase):
+    def test_latin_words_lowercased(self):
+        self.assertEqual(article_index.tokenize("Hong Kong, HK-2026"), ["hong", "kong", "hk", "2026"])
+
+    def test_cjk_bigrams_and_unigrams(self):
+        self.assertEqual(
+            article_index.tokenize("香港新聞"),
+            ["香港", "港新", "新聞", "香", "港", "新", "聞"],
+        )
+
+    def test_cjk_query_uses_bigrams(self):
+        self.assertEqual(article_index.tokenize("香港新聞", query=True), ["香港", "港新", "新聞"])
+        self.assertEqual(article_index.tokenize("港", query=True), ["港"])
+
+
+class TestArticleIndex(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, "articles.db")
+        self.index = article_index.ArticleIndex(self.path)
+        self.addCleanup(self.index.close)
+
+    def test_english_search_ranks_title_matches_first(self):
+        """Test that title matches outrank summary-only matches."""
+        self.index.add([
+            _article(1, "Markets rally", "Typhoon signal lifted as stocks recover"),
+            _article(2, "Typhoon signal number 8 raised", "Schools closed"),
+            _article(3, "Weather", "Sunny skies"),
+        ])
+
+        hits = self.index.search("typhoon signal")
+
+        self.assertEqual([h.link for h in hits], ["https://news.example.com/2", "https://news.example.com/1"])
+        self.assertGreater(hits[0].score, hits[1].score)
+
+    def test_chinese_search(self):
+        """Test that CJK text is searchable without word boundaries."""
+        self.index.add([
+            _article(1, "香港天文台發出八號風球"),
+            _article(2, "港島交通消息"),
+            _article(3, "明報新聞"),
+        ])
+
+        self.assertEqual([h.link for h in self.index.search("風球")], ["https://news.example.com/1"])
+        self.assertEqual(len(self.index.search("港")), 2)
+        self.assertEqual(self.index.search("港風"), [])
+
+    def test_html_is_stripped(self):
+        self.index.add([_article(1, "Title", "<p>Breaking &amp; <b>urgent</b></p>")])
+        self.assertEqual(len(self.index.search("urgent")), 1)
+        self.assertEqual(self.index.search("amp"), [])
+
+    def test_script_and_style_are_not_indexed(self):
+        self.index.add([_article(1, "Title", "<style>p{color:red}</style><p>Story</p><script>track()</script>")])
+        self.assertEqual(len(self.index.search("story")), 1)
+        self.assertEqual(self.index.search("track"), [])
+        self.assertEqual(self.index.search("color"), [])
+
+    def test_incremental_updates(self):
+        """Test that re-adding unchanged articles is a no-op and edits replace old text."""
+        self.assertEqual(self.index.add([_article(1, "Old headline")]), 1)
+        self.assertEqual(self.index.add([_article(1, "Old headline")]), 0)
+        self.assertEqual(self.index.add([_article(1, "New headline")]), 1)
+
+        self.assertEqual(len(self.index), 1)
+        self.assertEqual(self.index.search("old"), [])
+        self.assertEqual(len(self.index.search("new")), 1)
+
+    def test_index_persists(self):
+        self.index.add([_article(1, "Persistent story")])
+        self.index.close()
+
+        with article_index.ArticleIndex(self.path) as reopened:
+            self.assertEqual(reopened.search("persistent")[0].title, "Persistent story")
+
+    def test_candidate_cap_keeps_newest_matches(self):
+        """Test that only the newest matches are ranked unless the cap is lifted."""
+        self.index.add([_article(i, f"Typhoon update {i}") for i in range(1, 6)])
+
+        capped = self.index.search("typhoon", max_candidates=2)
+        self.assertEqual(sorted(h.link for h in capped), ["https://news.example.com/4", "https://news.example.com/5"])
+        self.assertEqual(len(self.index.search("typhoon", max_candidates=0)), 5)
+
+    def test_empty_query(self):
+        self.assertEqual(self.index.search("!!!"), [])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,88 @@
+import pickle
+import unittest
+
+from article_store import ArticleBatch, ArticleRecord
+
+
+ARTICLES = [
+    {
+        "title": f"Title {i}",
+        "link": f"https://news.example.com/2026/01/13/story-{i}",
+        "published": "2026-01-13T10:00:00",
+        "summary": f"Summary {i}",
+    }
+    for i in range(5)
+]
+
+
+class TestArticleBatch(unittest.TestCase):
+    def test_dict_view_round_trip(self):
+        """Test that indexing and iterating give back the original dicts."""
+        batch = ArticleBatch.from_articles(ARTICLES, feed="https://news.example.com/rss")
+
+        self.assertEqual(len(batch), 5)
+        self.assertEqual(batch[2], ARTICLES[2])
+        self.assertEqual(batch[-1], ARTICLES[-1])
+        self.assertEqual(batch[-5], ARTICLES[-5])
+        self.assertEqual(batch.as_dicts(), ARTICLES)
+        for i in (5, -6):
+            with self.assertRaises(IndexError):
+                batch[i]
+
+    def test_slices_give_lists_of_dicts(self):
+        """Test that slicing behaves like slicing a list of article dicts."""
+        batch = ArticleBatch.from_articles(ARTICLES)
+
+        self.assertEqual(batch[:3], ARTICLES[:3])
+        self.assertEqual(batch[3:10], ARTICLES[3:10])
+        self.assertEqual(batch[::-2], ARTICLES[::-2])
+        self.assertEqual(batch[5:], [])
+
+    def test_link_prefixes_are_interned(self):
+        """Test that a shared link prefix and feed are stored once."""
+        batch = ArticleBatch.from_articles(ARTICLES, feed="https://news.example.com/rss")
+
+        self.assertEqual(batch._prefixes, ["https://news.example.com/2026/01/13/"])
+        self.assertEqual(batch._feeds, ["https://news.example.com/rss"])
+        self.assertEqual(batch.feed(3), "https://news.example.com/rss")
+
+    def test_links_without_slash(self):
+        """Test that empty and relative links survive the prefix split."""
+        batch = ArticleBatch()
+        batch.append("a", "", "p", "s")
+        batch.append("b", "relative", "p", "s")
+
+        self.assertEqual(batch.link(0), "")
+        self.assertEqual(batch.link(1), "relative")
+
+    def test_records(self):
+        """Test the slotted record view."""
+        batch = ArticleBatch.from_articles(ARTICLES[:1], feed="f")
+        (record,) = batch.records()
+
+        self.assertIsInstance(record, ArticleRecord)
+        self.assertFalse(hasattr(record, "__dict__"))
+        self.assertEqual(record.feed, "f")
+        self.assertEqual(record.as_dict(), ARTICLES[0])
+
+    def test_pickle_round_trip(self):
+        """Test that a batch pickles compactly and can be appended to after loading."""
+        batch = ArticleBatch.from_articles(ARTICLES, feed="f")
+        loaded = pickle.loads(pickle.dumps(batch))
+
+        self.assertEqual(loaded.as_dicts(), ARTICLES)
+        loaded.append("x", "https://news.example.com/2026/01/13/x", "p", "s", "f")
+        self.assertEqual(len(loaded._prefixes), 1)
+        self.assertLess(len(pickle.dumps(batch)), len(pickle.dumps(ARTICLES)))
+
+    def test_extend(self):
+        first = ArticleBatch.from_articles(ARTICLES[:2], feed="a")
+        second = ArticleBatch.from_articles(ARTICLES[2:], feed="b")
+        first.extend(second)
+
+        self.assertEqual(first.as_dicts(), ARTICLES)
+        self.assertEqual(first.feed(4), "b")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,118 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+import pandas as pd
+
+import datadraft
+
+
+PAGE = """<html><body><table>
+<tr><th>Stock code</th><th>Name</th><th>Sector</th></tr>
+{rows}
+</table></body></html>"""
+
+
+def _page(rows):
+    body = "\n".join(f"<tr><td>{code}</td><td>{name}</td><td>{sector}</td></tr>" for code, name, sector in rows)
+    return PAGE.format(rows=body)
+
+
+class TestDiffRows(unittest.TestCase):
+    def test_insert_remove_change(self):
+        """Test that only inserted, removed and changed rows are reported."""
+        columns = ["Stock code", "Name"]
+        old = {"1": ["1", "CKH"], "2": ["2", "CLP"], "3": ["3", "HKCG"]}
+        new = {"1": ["1", "CKH"], "2": ["2", "CLP Holdings"], "5": ["5", "HSBC"]}
+
+        changes = datadraft.diff_rows(columns, old, columns, new)
+
+        self.assertEqual(changes, [
+            {"op": "change", "key": "2", "changes": {"Name": ["CLP", "CLP Holdings"]}},
+            {"op": "insert", "key": "5", "row": {"Stock code": "5", "Name": "HSBC"}},
+            {"op": "remove", "key": "3"},
+        ])
+
+    def test_added_column_is_a_change(self):
+        changes = datadraft.diff_rows(["k"], {"1": ["1"]}, ["k", "Sector"], {"1": ["1", "Utilities"]})
+        self.assertEqual(changes, [{"op": "change", "key": "1", "changes": {"Sector": ["", "Utilities"]}}])
+
+    def test_table_rows_key_fallback_and_duplicates(self):
+        """Test that a missing key column falls back to the first column."""
+        df = pd.DataFrame({"Code": ["1", "1", "2"], "Name": ["A", "B", None]})
+
+        key, columns, rows = datadraft.table_rows(df, "Stock code")
+
+        self.assertEqual(key, "Code")
+        self.assertEqual(columns, ["Code", "Name"])
+        self.assertEqual(rows, {"1": ["1", "A"], "1#2": ["1", "B"], "2": ["2", ""]})
+
+
+class TestMain(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = tmp.name
+        self.argv = [
+            "datadraft.py",
+            "--url", "https://example.com/list",
+            "--output", os.path.join(self.dir, "output.csv"),
+            "--snapshot", os.path.join(self.dir, "snapshot.json"),
+            "--changes", os.path.join(self.dir, "changes.ndjson"),
+        ]
+
+    def _run(self, html):
+        response = Mock(text=html, content=html.encode("utf-8"))
+        fetcher = Mock()
+        fetcher.get.return_value = response
+        with patch("datadraft.httpfetch.get_fetcher", return_value=fetcher), \
+                patch.object(sys, "argv", self.argv), patch("builtins.print"):
+            datadraft.main()
+        with open(os.path.join(self.dir, "changes.ndjson"), encoding="utf-8") as f:
+            return [json.loads(line) for line in f]
+
+    def test_incremental_scrapes(self):
+        """Test the first scrape, an unchanged page and an edited page."""
+        rows = [("1", "CKH", "Conglomerates"), ("2", "CLP", "Utilities")]
+        first = self._run(_page(rows))
+        self.assertEqual([c["op"] for c in first], ["insert", "insert"])
+
+        with patch("datadraft.pd.read_html") as read_html:
+            self.assertEqual(self._run(_page(rows)), [])
+        read_html.assert_not_called()
+
+        rows[1] = ("2", "CLP Holdings", "Utilities")
+        self.assertEqual(self._run(_page(rows)), [
+            {"op": "change", "key": "2", "changes": {"Name": ["CLP", "CLP Holdings"]}},
+        ])
+        with open(os.path.join(self.dir, "output.csv"), encoding="utf-8") as f:
+            self.assertIn("CLP Holdings", f.read())
+
+    def test_unchanged_page_still_writes_missing_output(self):
+        """Test that the unchanged-page shortcut is not taken for a new output file."""
+        rows = [("1", "CKH", "Conglomerates")]
+        self._run(_page(rows))
+        new_output = os.path.join(self.dir, "other.csv")
+        self.argv[self.argv.index("--output") + 1] = new_output
+
+        self.assertEqual(self._run(_page(rows)), [])
+        with open(new_output, encoding="utf-8") as f:
+            self.assertIn("CKH", f.read())
+
+    @unittest.skipIf(sys.platform == "win32", "POSIX file modes")
+    def test_outputs_follow_umask(self):
+        """Test that the snapshot and changeset get the same mode as output.csv."""
+        old_umask = os.umask(0o022)
+        self.addCleanup(os.umask, old_umask)
+        self._run(_page([("1", "CKH", "Conglomerates")]))
+
+        for name in ("output.csv", "snapshot.json", "changes.ndjson"):
+            mode = os.stat(os.path.join(self.dir, name)).st_mode & 0o777
+            self.assertEqual(mode, 0o644, name)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,161 @@
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest.mock import patch
+
+import httpfetch
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Serves canned responses configured on the server object."""
+
+    def do_GET(self):
+        server = self.server
+        server.hits[self.path] = server.hits.get(self.path, 0) + 1
+        status, headers, body = server.routes[self.path](self)
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestFetcher(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.server.routes = {}
+        self.server.hits = {}
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache = httpfetch.ResponseCache(Path(tmp.name), max_bytes=1024 * 1024)
+        self.fetcher = httpfetch.Fetcher(cache=self.cache, retries=2, backoff_factor=0)
+        self.addCleanup(self.fetcher.close)
+
+    def url(self, path):
+        return f"http://127.0.0.1:{self.server.server_port}{path}"
+
+    def test_fresh_response_served_from_cache(self):
+        """Test that a max-age response is reused without another request."""
+        self.server.routes["/fresh"] = lambda h: (200, {"Cache-Control": "max-age=60"}, b"hello")
+
+        first = self.fetcher.get(self.url("/fresh"))
+        second = self.fetcher.get(self.url("/fresh"))
+
+        self.assertEqual(first.content, b"hello")
+        self.assertEqual(second.content, b"hello")
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(self.server.hits["/fresh"], 1)
+
+    def test_stale_response_revalidated_with_etag(self):
+        """Test that a stale entry is revalidated and a 304 reuses the body."""
+        def route(handler):
+            if handler.headers.get("If-None-Match") == '"v1"':
+                return 304, {"ETag": '"v1"'}, b""
+            return 200, {"ETag": '"v1"', "Cache-Control": "no-cache"}, b"payload"
+
+        self.server.routes["/etag"] = route
+
+        self.fetcher.get(self.url("/etag"))
+        second = self.fetcher.get(self.url("/etag"))
+
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.content, b"payload")
+        self.assertEqual(self.server.hits["/etag"], 2)
+
+    def test_no_store_not_cached(self):
+        """Test that no-store responses are always refetched."""
+        self.server.routes["/nostore"] = lambda h: (200, {"Cache-Control": "no-store, max-age=60"}, b"x")
+
+        self.fetcher.get(self.url("/nostore"))
+        self.fetcher.get(self.url("/nostore"))
+
+        self.assertEqual(self.server.hits["/nostore"], 2)
+
+    def test_retries_server_errors(self):
+        """Test that 503 responses are retried before giving up."""
+        def route(handler):
+            if handler.server.hits["/flaky"] < 3:
+                return 503, {}, b"busy"
+            return 200, {}, b"ok"
+
+        self.server.routes["/flaky"] = route
+
+        response = self.fetcher.get(self.url("/flaky"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, b"ok")
+        self.assertEqual(self.server.hits["/flaky"], 3)
+
+    def test_cache_evicts_least_recently_used(self):
+        """Test that the cache stays under its size budget."""
+        self.cache.max_bytes = 250
+        for i in range(5):
+            self.server.routes[f"/big{i}"] = lambda h: (200, {"Cache-Control": "max-age=60"}, b"x" * 100)
+            self.fetcher.get(self.url(f"/big{i}"))
+
+        total = sum(p.stat().st_size for p in self.cache.directory.glob("*.body"))
+        self.assertLessEqual(total, 250)
+        self.assertIsNone(self.cache.get(self.url("/big0")))
+        self.assertIsNotNone(self.cache.get(self.url("/big4")))
+
+    def test_cache_scans_directory_once(self):
+        """Test that stores keep a running total instead of rescanning the directory."""
+        cache = httpfetch.ResponseCache(self.cache.directory, max_bytes=250)
+        cache._write(self.url("/old"), {}, 60.0, b"o" * 100)
+        cache = httpfetch.ResponseCache(self.cache.directory, max_bytes=250)
+        scans = []
+        original = Path.glob
+
+        def counting_glob(path, pattern):
+            scans.append(pattern)
+            return original(path, pattern)
+
+        with patch.object(Path, "glob", counting_glob):
+            cache._write(self.url("/n0"), {}, 60.0, b"x" * 100)
+            # Reading an entry makes it the most recently used...
+            self.assertIsNotNone(cache.get(self.url("/old")))
+            # ...so going over budget evicts /n0 instead.
+            cache._write(self.url("/n1"), {}, 60.0, b"x" * 100)
+            for i in range(2, 5):
+                cache._write(self.url(f"/n{i}"), {}, 60.0, b"x" * 100)
+
+        self.assertEqual(len(scans), 1)
+        self.assertEqual(cache._total, 200)
+        self.assertLessEqual(sum(p.stat().st_size for p in cache.directory.glob("*.body")), 250)
+        self.assertIsNotNone(cache.get(self.url("/n4")))
+        self.assertIsNone(cache.get(self.url("/n0")))
+
+
+class TestFreshness(unittest.TestCase):
+    def test_max_age_wins_over_expires(self):
+        headers = {"cache-control": "public, max-age=30", "expires": "Thu, 01 Jan 1970 00:00:00 GMT"}
+        self.assertEqual(httpfetch._freshness_lifetime(headers), 30.0)
+
+    def test_s_maxage_is_ignored_by_private_cache(self):
+        headers = {"cache-control": "s-maxage=3600, max-age=0"}
+        self.assertEqual(httpfetch._freshness_lifetime(headers), 0.0)
+        self.assertEqual(httpfetch._freshness_lifetime({"cache-control": "s-maxage=3600"}), 0.0)
+
+    def test_expires_relative_to_date(self):
+        headers = {
+            "date": "Mon, 19 Oct 2026 10:00:00 GMT",
+            "expires": "Mon, 19 Oct 2026 10:05:00 GMT",
+        }
+        self.assertEqual(httpfetch._freshness_lifetime(headers), 300.0)
+
+    def test_no_freshness_information(self):
+        self.assertEqual(httpfetch._freshness_lifetime({}), 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
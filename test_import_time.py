@@ -0,0 +1,64 @@
+import os
+import subprocess
+import sys
+import unittest
+
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Cold-start budget per script in milliseconds (cumulative import time of the
+# script module itself, as reported by `python -X importtime`). Loading any of
+# the heavy dependencies eagerly blows well past these.
+IMPORT_BUDGET_MS = {
+    "adstxt": 150,
+    "datadraft": 150,
+    "parser004hk01": 150,
+    "rss_news_parser": 150,
+}
+
+HEAVY_MODULES = {"bs4", "feedparser", "pandas", "requests"}
+
+
+def _importtime(args):
+    """Run Python with -X importtime and return {module: cumulative_us}."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=HERE,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        timeout=60,
+    )
+    timings = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        try:
+            timings[name.strip()] = int(cumulative)
+        except ValueError:
+            continue  # header row
+    return proc.returncode, timings
+
+
+class TestImportTime(unittest.TestCase):
+    def test_scripts_within_import_budget(self):
+        """Test that importing each script stays within its cold-start budget."""
+        for module, budget_ms in IMPORT_BUDGET_MS.items():
+            with self.subTest(module=module):
+                returncode, timings = _importtime(["-c", f"import {module}"])
+                self.assertEqual(returncode, 0)
+                self.assertIn(module, timings)
+                self.assertLess(timings[module] / 1000, budget_ms)
+
+    def test_help_does_not_load_heavy_dependencies(self):
+        """Test that `--help` never imports pandas, feedparser, bs4 or requests."""
+        for module in IMPORT_BUDGET_MS:
+            with self.subTest(module=module):
+                returncode, timings = _importtime([f"{module}.py", "--help"])
+                self.assertEqual(returncode, 0)
+                self.assertFalse(HEAVY_MODULES & set(timings), sorted(HEAVY_MODULES & set(timings)))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,113 @@
+import json
+import os
+import tempfile
+import unittest
+
+import metrics
+
+
+class TestMetrics(unittest.TestCase):
+    def tearDown(self):
+        metrics.disable()
+
+    def test_counter_prometheus_output(self):
+        """Test that counters are exported with their labels."""
+        m = metrics.Metrics()
+        m.inc("pyusage_articles_total", 3, url="https://example.com/feed")
+        m.inc("pyusage_articles_total", 2, url="https://example.com/feed")
+
+        text = m.to_prometheus()
+
+        self.assertIn("# TYPE pyusage_articles_total counter", text)
+        self.assertIn('pyusage_articles_total{url="https://example.com/feed"} 5', text)
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Test that histogram buckets, sum and count follow the exposition format."""
+        m = metrics.Metrics(buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 2.0):
+            m.observe(metrics.STAGE_SECONDS, value, stage="parse")
+
+        text = m.to_prometheus()
+
+        self.assertIn('pyusage_stage_seconds_bucket{stage="parse",le="0.1"} 1', text)
+        self.assertIn('pyusage_stage_seconds_bucket{stage="parse",le="1.0"} 2', text)
+        self.assertIn('pyusage_stage_seconds_bucket{stage="parse",le="+Inf"} 3', text)
+        self.assertIn('pyusage_stage_seconds_count{stage="parse"} 3', text)
+        self.assertIn('pyusage_stage_seconds_sum{stage="parse"} 2.55', text)
+
+    def test_label_values_are_escaped(self):
+        """Test that quotes and backslashes in label values are escaped."""
+        m = metrics.Metrics()
+        m.inc("x_total", url='a"b\\c')
+        self.assertIn('x_total{url="a\\"b\\\\c"} 1', m.to_prometheus())
+
+    def test_timer_records_stage_and_errors(self):
+        """Test that timers observe durations and count failures."""
+        m = metrics.Metrics()
+        with m.timer("fetch", url="u"):
+            pass
+        with self.assertRaises(ValueError):
+            with m.timer("fetch", url="u"):
+                raise ValueError("boom")
+
+        data = m.to_dict()
+        (hist,) = data["histograms"]
+        self.assertEqual(hist["labels"], {"stage": "fetch", "url": "u"})
+        self.assertEqual(hist["count"], 2)
+        self.assertEqual(data["counters"][0]["name"], metrics.STAGE_ERRORS)
+
+    def test_write_json_and_prometheus(self):
+        """Test that the output format follows the file extension."""
+        m = metrics.Metrics()
+        m.inc("x_total")
+        with tempfile.TemporaryDirectory() as tmp:
+            json_path = os.path.join(tmp, "m.json")
+            prom_path = os.path.join(tmp, "m.prom")
+            m.write(json_path)
+            m.write(prom_path)
+
+            with open(json_path, encoding="utf-8") as f:
+                self.assertEqual(json.load(f)["counters"][0]["value"], 1.0)
+            with open(prom_path, encoding="utf-8") as f:
+                self.assertIn("x_total 1", f.read())
+
+    def test_merge_adds_counters_and_histograms(self):
+        """Test that a registry exported by another process can be merged in."""
+        worker = metrics.Metrics(buckets=(0.1, 1.0))
+        worker.inc("x_total", 2, url="u")
+        worker.observe(metrics.STAGE_SECONDS, 0.5, stage="parse")
+        parent = metrics.Metrics(buckets=(0.1, 1.0))
+        parent.inc("x_total", 1, url="u")
+        parent.observe(metrics.STAGE_SECONDS, 0.05, stage="parse")
+
+        parent.merge(worker.to_dict())
+
+        text = parent.to_prometheus()
+        self.assertIn('x_total{url="u"} 3', text)
+        self.assertIn('pyusage_stage_seconds_bucket{stage="parse",le="0.1"} 1', text)
+        self.assertIn('pyusage_stage_seconds_bucket{stage="parse",le="1.0"} 2', text)
+        self.assertIn('pyusage_stage_seconds_count{stage="parse"} 2', text)
+
+    def test_merge_rejects_other_buckets(self):
+        worker = metrics.Metrics(buckets=(0.5,))
+        worker.observe("y", 0.1)
+        with self.assertRaises(ValueError):
+            metrics.Metrics().merge(worker.to_dict())
+
+    def test_disabled_by_default(self):
+        """Test that the default registry ignores every hook."""
+        m = metrics.current()
+        self.assertFalse(m.enabled)
+        m.inc("x_total")
+        m.observe("y", 1.0)
+        with m.timer("fetch"):
+            pass
+
+    def test_enable_sets_current_registry(self):
+        m = metrics.enable()
+        self.assertIs(metrics.current(), m)
+        self.assertTrue(m.enabled)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
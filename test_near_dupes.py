@@ -0,0 +1,74 @@
+import os
+import tempfile
+import unittest
+
+import near_dupes
+
+
+def _article(title, summary=""):
+    return {"title": title, "link": f"https://example.com/{abs(hash(title))}", "published": "", "summary": summary}
+
+
+class TestNearDupes(unittest.TestCase):
+    def setUp(self):
+        self.articles = [
+            _article(
+                "Typhoon Wipha forces Hong Kong to raise No. 8 signal",
+                "<p>The Observatory said the signal would remain in force until at least noon on Sunday.</p>",
+            ),
+            _article("Stocks rally as tech earnings beat forecasts", "Shares in chipmakers led the gains."),
+            _article(
+                "Typhoon Wipha forces HK to raise No 8 signal",
+                "The Observatory said the signal would remain in force until at least noon on Sunday.",
+            ),
+        ]
+
+    def test_syndicated_copies_are_grouped(self):
+        """Test that lightly edited copies of one story form a group."""
+        self.assertEqual(near_dupes.find_near_duplicates(self.articles), [[0, 2]])
+
+    def test_unrelated_articles_are_not_grouped(self):
+        """Test that distinct stories are left alone."""
+        groups = near_dupes.find_near_duplicates(self.articles[:2])
+        self.assertEqual(groups, [])
+
+    def test_chinese_copies_are_grouped(self):
+        """Test that CJK text without spaces is compared character by character."""
+        articles = [
+            _article("天文台發出八號颶風信號",
+                     "天文台表示信號會維持至中午"),
+            _article("天文台發出八號颶風信號！",
+                     "天文台表示信號會維持至中午"),
+        ]
+        self.assertEqual(near_dupes.find_near_duplicates(articles), [[0, 1]])
+
+    def test_empty_articles_are_never_duplicates(self):
+        """Test that articles without text are not grouped with each other."""
+        articles = [_article(""), _article("")]
+        self.assertEqual(near_dupes.find_near_duplicates(articles), [])
+
+    def test_similarity_of_identical_text(self):
+        sig = near_dupes.minhash_signature("the quick brown fox jumps over the lazy dog")
+        self.assertEqual(len(sig), near_dupes.DEFAULT_NUM_PERM)
+        self.assertEqual(near_dupes.similarity(sig, sig), 1.0)
+
+    def test_bands_must_divide_num_perm(self):
+        with self.assertRaises(ValueError):
+            near_dupes.find_near_duplicates(self.articles, num_perm=64, bands=10)
+
+    def test_signature_cache_round_trip(self):
+        """Test that cached signatures are reused on the next run."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "cache", "signatures.db")
+            with near_dupes.SignatureCache(path) as cache:
+                first = near_dupes.find_near_duplicates(self.articles, cache=cache)
+
+            with near_dupes.SignatureCache(path) as cache:
+                text = f"{self.articles[0]['title']}\n{self.articles[0]['summary']}"
+                cached = cache.get(near_dupes.SignatureCache.key(text, near_dupes.DEFAULT_NUM_PERM))
+                self.assertEqual(cached, near_dupes.minhash_signature(text))
+                self.assertEqual(near_dupes.find_near_duplicates(self.articles, cache=cache), first)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
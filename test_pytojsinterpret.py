@@ -0,0 +1,60 @@
+import io
+import os
+import tempfile
+import unittest
+
+import pytojsinterpret
+
+
+SAMPLE = """\
+# comment
+if x > 0:
+	print("Positive")
+else:
+	print("Other")
+for i in range(3):
+	while i < 2:
+		i += 1
+"""
+
+
+class TestPyToJsInterpret(unittest.TestCase):
+    def test_translate_lines_matches_string_api(self):
+        """Test that streaming over a file object gives the same output."""
+        expected = pytojsinterpret.translate_python_to_javascript(SAMPLE)
+        streamed = "\n".join(pytojsinterpret.translate_lines(io.StringIO(SAMPLE)))
+        self.assertEqual(streamed, expected)
+
+    def test_translate_lines_closes_blocks(self):
+        """Test that open blocks are closed when the input ends."""
+        lines = list(pytojsinterpret.translate_lines(["for i in range(3):\n", "\twhile i < 2:\n", "\t\ti += 1\n"]))
+        self.assertEqual(lines[0], "for (let i = 0; i < 3; i += 1) {")
+        self.assertEqual(lines[1], "while (i < 2) {")
+        self.assertEqual(lines[-2:], ["}", "}"])
+
+    def test_translate_lines_is_lazy(self):
+        """Test that output is produced before the input is exhausted."""
+        def source():
+            yield 'print("a")\n'
+            raise AssertionError("input consumed too eagerly")
+
+        lines = pytojsinterpret.translate_lines(source())
+        self.assertEqual(next(lines), 'console.log("a")')
+
+    def test_translate_file(self):
+        """Test translating a file on disk to another file."""
+        with tempfile.TemporaryDirectory() as tmp:
+            src = os.path.join(tmp, "in.py")
+            dst = os.path.join(tmp, "out.js")
+            with open(src, "w", encoding="utf-8") as f:
+                f.write(SAMPLE)
+
+            pytojsinterpret.translate_file(src, dst)
+
+            with open(dst, encoding="utf-8") as f:
+                written = f.read()
+        self.assertEqual(written, pytojsinterpret.translate_python_to_javascript(SAMPLE) + "\n")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -1,11 +1,20 @@
+import os
+import tempfile
 import unittest
 from datetime import datetime
 from unittest.mock import Mock, patch
 
+import metrics
 import rss_news_parser
 
 
 class TestRSSNewsParser(unittest.TestCase):
+    def setUp(self):
+        # Keep tests offline: feedparser.parse is mocked, so the fetched body is unused.
+        patcher = patch("rss_news_parser._fetch_feed", return_value=(b"", {}))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     def test_parse_rss_feed_basic(self):
         """Test parsing a basic RSS feed with standard fields."""
         mock_feed = Mock()
@@ -137,5 +146,75 @@ class TestRSSNewsParser(unittest.TestCase):
             self.assertEqual(article["title"], f"Article {i}")
 
 
+FEED_TEMPLATE = """<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Feed {n}</title>
+{items}
+</channel></rss>
+"""
+
+ITEM_TEMPLATE = """<item><title>Feed {n} item {i}</title><link>https://example.com/{n}/{i}</link>
+<pubDate>Tue, 13 Jan 2026 10:00:00 GMT</pubDate><description>Summary {i}</description></item>"""
+
+
+class TestIterRSSFeeds(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.feeds = []
+        for n in range(6):
+            path = os.path.join(tmp.name, f"feed{n}.xml")
+            items = "\n".join(ITEM_TEMPLATE.format(n=n, i=i) for i in range(n + 1))
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(FEED_TEMPLATE.format(n=n, items=items))
+            self.feeds.append(path)
+
+    def test_process_pool_matches_sequential(self):
+        """Test that sharded multi-process parsing returns the same results in order."""
+        sequential = list(rss_news_parser.iter_rss_feeds(self.feeds))
+        parallel = list(rss_news_parser.iter_rss_feeds(self.feeds, processes=2, shard_size=2))
+
+        self.assertEqual([r.feed_url for r in parallel], self.feeds)
+        self.assertEqual(parallel, sequential)
+        self.assertEqual(len(parallel[3].articles), 4)
+        self.assertEqual(parallel[3].articles[0]["title"], "Feed 3 item 0")
+
+    def test_worker_metrics_are_merged(self):
+        """Test that fetch/parse timings and counters recorded in workers reach the parent."""
+        m = metrics.enable()
+        self.addCleanup(metrics.disable)
+
+        list(rss_news_parser.iter_rss_feeds(self.feeds, processes=2, shard_size=2))
+
+        data = m.to_dict()
+        articles = {c["labels"]["url"]: c["value"] for c in data["counters"] if c["name"] == "pyusage_articles_total"}
+        self.assertEqual(articles, {feed: n + 1 for n, feed in enumerate(self.feeds)})
+        stages = {(h["labels"]["stage"], h["labels"]["url"]) for h in data["histograms"]}
+        self.assertEqual(stages, {(stage, feed) for stage in ("fetch", "parse") for feed in self.feeds})
+
+    def test_summary_options_reach_worker_processes(self):
+        """Test that HTML summaries are cleaned and truncated in every mode."""
+        path = os.path.join(os.path.dirname(self.feeds[0]), "html.xml")
+        item = ITEM_TEMPLATE.format(n=9, i=0).replace(
+            "Summary 0", "&lt;p&gt;First point. &lt;b&gt;Second&lt;/b&gt; point.&lt;/p&gt;"
+        )
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(FEED_TEMPLATE.format(n=9, items=item))
+        feeds = [path, self.feeds[0]]
+
+        for processes in (1, 2):
+            results = list(rss_news_parser.iter_rss_feeds(feeds, processes=processes, summary_sentences=1))
+            self.assertEqual(results[0].articles[0]["summary"], "First point.")
+        raw = list(rss_news_parser.iter_rss_feeds(feeds, raw_summary=True))
+        self.assertIn("<b>Second</b>", raw[0].articles[0]["summary"])
+
+    def test_errors_reported_per_feed(self):
+        """Test that a failing feed does not affect the others."""
+        with patch("rss_news_parser.parse_rss_feed", side_effect=[[], Exception("boom")]):
+            results = list(rss_news_parser.iter_rss_feeds(["a", "b"]))
+
+        self.assertEqual(results[0], rss_news_parser.FeedResult("a", [], None))
+        self.assertEqual(results[1], rss_news_parser.FeedResult("b", None, "boom"))
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -0,0 +1,75 @@
+import unittest
+from unittest.mock import patch
+
+import summary_text
+from summary_text import clean_summary
+
+
+class TestCleanSummary(unittest.TestCase):
+    def test_strips_markup_and_decodes_entities(self):
+        """Test that tags, scripts and styles are dropped and entities decoded."""
+        markup = (
+            '<div style="color:red"><img src="a.png"/><p>Rates&nbsp;rise &amp; '
+            "markets <b>fall</b>.</p><script>track()</script><style>p{}</style>"
+            "<p>Analysts were surprised.</p></div>"
+        )
+        self.assertEqual(clean_summary(markup), "Rates rise & markets fall. Analysts were surprised.")
+
+    def test_block_tags_separate_words(self):
+        self.assertEqual(clean_summary("<p>one</p><p>two</p>three<br>four"), "one two three four")
+
+    def test_plain_text_is_unchanged(self):
+        self.assertEqual(clean_summary("Test summary"), "Test summary")
+
+    def test_truncates_at_word_boundary(self):
+        """Test that a character limit cuts between words and adds an ellipsis."""
+        text = clean_summary("<p>The quick brown fox jumps over the lazy dog</p>", max_chars=20)
+        self.assertEqual(text, "The quick brown fox…")
+
+    def test_text_within_limit_is_not_marked(self):
+        self.assertEqual(clean_summary("<p>Short.</p>", max_chars=6), "Short.")
+
+    def test_truncates_unspaced_text(self):
+        """Test that CJK text without spaces is cut at the character limit."""
+        text = clean_summary("天" * 50, max_chars=10)
+        self.assertEqual(text, "天" * 9 + "…")
+
+    def test_ellipsis_counts_towards_limit(self):
+        """Test that a truncated summary is never longer than max_chars."""
+        self.assertEqual(clean_summary("<p>Hello world</p>", max_chars=5), "Hell…")
+        for limit in range(1, 40):
+            text = clean_summary("<p>The quick brown fox jumps over the lazy dog</p>", max_chars=limit)
+            self.assertLessEqual(len(text), limit)
+
+    def test_sentence_limit(self):
+        """Test sentence truncation for Latin and CJK punctuation."""
+        markup = "<p>The U.S. economy grew.</p><p>Markets rose! Bonds fell?</p>"
+        self.assertEqual(clean_summary(markup, max_sentences=2), "The U.S. economy grew. Markets rose!")
+        cjk = "風球生效。市民留家。其他"
+        self.assertEqual(clean_summary(cjk, max_sentences=1), "風球生效。")
+
+    def test_sentence_end_not_split_at_chunk_boundary(self):
+        """Test that a period at the end of a parser chunk is not taken as a sentence end."""
+        markup = "<p>GDP rose 3.5 percent growth. Exports fell.</p>"
+        with patch.object(summary_text, "_CHUNK_SIZE", markup.index("3.") + 2):
+            text = clean_summary(markup, max_sentences=1)
+        self.assertEqual(text, "GDP rose 3.5 percent growth.")
+
+    def test_stops_parsing_once_limit_is_reached(self):
+        """Test that a huge fragment is not tokenized past the limit."""
+        markup = "<p>" + "word " * 200_000 + "</p>"
+        with patch.object(summary_text._TextExtractor, "feed", autospec=True,
+                          side_effect=summary_text._TextExtractor.feed) as feed:
+            text = clean_summary(markup, max_chars=100)
+        self.assertTrue(text.endswith("…"))
+        self.assertLessEqual(feed.call_count, 2)
+
+    def test_rejects_invalid_limits(self):
+        with self.assertRaises(ValueError):
+            clean_summary("x", max_chars=0)
+        with self.assertRaises(ValueError):
+            clean_summary("x", max_sentences=0)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)